@@ -16,28 +16,299 @@ GitHub: https://github.com/elifsudeates/depshield
 License: MIT
 """
 
-from flask import Flask, request, jsonify, send_from_directory, Response, stream_with_context
+from flask import Flask, abort, g, request, jsonify, send_from_directory, Response, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-import json
+from flask_compress import Compress
+import atexit
 import csv
-import io
-from datetime import datetime
+import os
+import time
+import zlib
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 
 # Import DepShield modules
 from depshield import (
     log,
+    cache,
+    osv_cache,
+    set_io_executor,
     get_repo_info,
+    parse_repo_url,
     scan_with_progress
 )
-from depshield.config import APP_NAME, APP_VERSION
+from depshield.metrics import (
+    SSE_EVENT_INTERVALS,
+    record_route_latency,
+    route_latency_summary,
+    http_cache_summary
+)
+from depshield.config import (
+    APP_NAME,
+    APP_VERSION,
+    CACHE_TYPE,
+    CACHE_REDIS_URL,
+    CACHE_DEFAULT_TIMEOUT,
+    CACHE_THRESHOLD,
+    OSV_CACHE_THRESHOLD,
+    IO_MAX_WORKERS,
+    DEBUG_STATS
+)
 
 
 # =============================================================================
 # FLASK APPLICATION SETUP
 # =============================================================================
 
+class _OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    
+    Handles request.json parsing and jsonify() output for every endpoint,
+    including the large scan results posted to the export routes.
+    """
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__, static_folder='static')
-CORS(app)  # Enable Cross-Origin Resource Sharing for API access
+app.json = _OrjsonProvider(app)
+# Enable Cross-Origin Resource Sharing for the API only; preflights are
+# cached by the browser for a day
+CORS(app, resources={r"/api/*": {"origins": "*", "max_age": 86400}})
+
+# Compress buffered JSON responses (e.g. /api/scan results)
+# Streamed responses are left alone: this Flask-Compress version compresses
+# a stream by reading it whole with get_data(), which would undo streaming.
+# The scan stream and the exports are gzipped by _gzip_stream() instead
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_LEVEL'] = 6
+app.config['COMPRESS_MIN_SIZE'] = 500
+app.config['COMPRESS_STREAMS'] = False
+Compress(app)
+
+# Memoize GitHub lookups and scan results; OSV results get their own cache
+# with a higher entry limit (see depshield/cache.py)
+cache.init_app(app, config={
+    'CACHE_TYPE': CACHE_TYPE,
+    'CACHE_REDIS_URL': CACHE_REDIS_URL,
+    'CACHE_DEFAULT_TIMEOUT': CACHE_DEFAULT_TIMEOUT,
+    'CACHE_THRESHOLD': CACHE_THRESHOLD
+})
+osv_cache.init_app(app, config={
+    'CACHE_TYPE': CACHE_TYPE,
+    'CACHE_REDIS_URL': CACHE_REDIS_URL,
+    'CACHE_DEFAULT_TIMEOUT': CACHE_DEFAULT_TIMEOUT,
+    'CACHE_THRESHOLD': OSV_CACHE_THRESHOLD
+})
+
+# Shared thread pool for OSV/GitHub fan-out across all scans
+_IO_POOL = ThreadPoolExecutor(max_workers=IO_MAX_WORKERS, thread_name_prefix='depshield-io')
+set_io_executor(_IO_POOL)
+atexit.register(_IO_POOL.shutdown, wait=False)
+
+# Requests slower than this (in seconds) are logged as warnings
+app.config['MAX_ROUTE_LATENCY'] = 1.0
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+# Server-Sent Event framing, pre-encoded once
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
+
+def _sse(event, _prefix=_SSE_PREFIX, _suffix=_SSE_SUFFIX, _dumps=orjson.dumps):
+    """
+    Format an event dictionary as a Server-Sent Event message.
+    
+    Args:
+        event: Event dictionary (must contain a 'type' key)
+    
+    Returns:
+        SSE message as bytes.
+    """
+    return _prefix + _dumps(event) + _suffix
+
+
+def _gzip_stream(chunks, level=6, sync=True):
+    """
+    Gzip a stream of chunks as they are produced.
+    
+    With sync, each chunk is followed by a sync flush, so the client can
+    decompress and handle every SSE event as soon as it arrives while the
+    repetitive JSON of later events still compresses against the earlier
+    ones. Downloads pass sync=False and let zlib emit full blocks.
+    
+    Args:
+        chunks: Iterable of bytes or str (encoded as UTF-8)
+        level: zlib compression level
+        sync: Flush the compressor after every chunk
+    
+    Yields:
+        Gzip-compressed bytes.
+    """
+    # wbits=31 writes a gzip header and trailer instead of raw zlib
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        data = compressor.compress(chunk)
+        if sync:
+            data += compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _download_response(stream, mimetype, filename):
+    """
+    Build a streamed file download, gzipped if the client accepts it.
+    
+    Args:
+        stream: Generator of response chunks
+        mimetype: Content type of the file
+        filename: Suggested download file name
+    
+    Returns:
+        Streamed Response.
+    """
+    headers = {
+        'Content-Disposition': f'attachment;filename={filename}',
+        'Vary': 'Accept-Encoding'
+    }
+    
+    if 'gzip' in request.accept_encodings:
+        stream = _gzip_stream(stream, app.config['COMPRESS_LEVEL'], sync=False)
+        headers['Content-Encoding'] = 'gzip'
+    
+    return Response(stream_with_context(stream), mimetype=mimetype, headers=headers)
+
+
+# Report lists that the JSON export writes one item at a time
+_STREAMED_LISTS = frozenset(('dependencies', 'vulnerabilities'))
+
+
+def _dumps_indented(value, newline):
+    """Encode a value with 2-space indentation, nested under `newline`."""
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2).replace(b'\n', newline)
+
+
+class _Echo:
+    """
+    File-like object that returns what is written to it.
+    
+    Lets csv.writer format a single row and hand it straight back,
+    so CSV exports can be streamed row by row instead of buffered.
+    """
+    
+    def write(self, value):
+        return value
+
+
+# CSV export column labels
+_CSV_HEADER = (
+    'Package', 'Version', 'Ecosystem', 
+    'Vulnerability ID', 'CVE', 'Severity', 
+    'CVSS Score', 'Summary'
+)
+
+# Header line, formatted once at import
+_CSV_HEADER_ROW = csv.writer(_Echo()).writerow(_CSV_HEADER)
+
+
+def _quick_validate(repo_url):
+    """
+    Validate a repository URL without any network access.
+    
+    Endpoints call this before get_repo_info() so malformed or
+    unsupported URLs are rejected without spending GitHub API calls.
+    
+    Args:
+        repo_url: Repository URL from the request
+    
+    Returns:
+        Tuple of (ok, error_message):
+        - On success: (True, '')
+        - On failure: (False, error_message)
+    """
+    if not repo_url:
+        return False, 'Repository URL is required'
+    
+    # Currently only GitHub is supported
+    if not parse_repo_url(repo_url):
+        return False, 'Currently only GitHub repositories are supported'
+    
+    return True, ''
+
+
+# =============================================================================
+# INSTRUMENTATION
+# =============================================================================
+
+@app.before_request
+def _start_timer():
+    """Remember when the current request started."""
+    g.request_start = time.perf_counter()
+
+
+@app.after_request
+def _record_latency(response):
+    """
+    Record per-route latency and log slow routes.
+    
+    For streamed responses this measures the time to the first byte,
+    not the duration of the whole stream.
+    """
+    start = g.pop('request_start', None)
+    if start is not None and request.endpoint:
+        elapsed = time.perf_counter() - start
+        record_route_latency(request.endpoint, elapsed)
+        
+        if elapsed > app.config['MAX_ROUTE_LATENCY']:
+            log(f"Slow route {request.method} {request.path}: {elapsed:.2f}s", "WARN")
+    return response
+
+
+@app.route('/debug/stats', methods=['GET'])
+def debug_stats():
+    """
+    Report runtime metrics for performance tuning.
+    
+    Only served when DEBUG_STATS is set or the app runs in debug mode;
+    otherwise the endpoint answers 404.
+    
+    Returns:
+        JSON object with:
+        - routes: p50/p95 latency per endpoint
+        - sse_event_interval: p50/p95 time between scan stream events
+        - http_cache: GitHub HTTP cache hits, misses and hit ratio
+        - io_pool: size and queue depth of the shared I/O pool
+    """
+    if not (DEBUG_STATS or app.debug):
+        abort(404)
+    
+    return jsonify({
+        'routes': route_latency_summary(),
+        'sse_event_interval': SSE_EVENT_INTERVALS.summary(),
+        'http_cache': http_cache_summary(),
+        'io_pool': {
+            'max_workers': IO_MAX_WORKERS,
+            'queued': _IO_POOL._work_queue.qsize()
+        }
+    })
 
 
 # =============================================================================
@@ -125,36 +396,44 @@ def api_scan_stream():
     """
     repo_url = request.args.get('url', '').strip()
     
-    if not repo_url:
-        return jsonify({'error': 'Repository URL is required'}), 400
+    ok, error = _quick_validate(repo_url)
+    if not ok:
+        return jsonify({'error': error}), 400
     
     # Get repository information
     repo_info = get_repo_info(repo_url)
     
-    # Currently only GitHub is supported
-    if repo_info['platform'] != 'GitHub':
-        return jsonify({'error': 'Currently only GitHub repositories are supported'}), 400
-    
-    if repo_info['owner'] == 'Unknown' or repo_info['name'] == 'Unknown':
-        return jsonify({'error': 'Invalid repository URL'}), 400
-    
     def generate():
         """Generator function for SSE stream."""
         # Send initial event with repo info
-        yield f"data: {json.dumps({'type': 'start', 'repo_info': repo_info})}\n\n"
+        yield _sse({'type': 'start', 'repo_info': repo_info})
         
         # Stream scan progress
-        for event in scan_with_progress(repo_info['owner'], repo_info['name']):
-            yield event
+        last = time.perf_counter()
+        for event in scan_with_progress(repo_info['owner'], repo_info['name'], repo_info):
+            now = time.perf_counter()
+            SSE_EVENT_INTERVALS.add(now - last)
+            last = now
+            yield _sse(event)
+    
+    headers = {
+        'Cache-Control': 'no-cache',
+        'Connection': 'keep-alive',
+        'X-Accel-Buffering': 'no',  # Disable nginx buffering
+        'Access-Control-Allow-Origin': '*',  # Set up front, flask-cors leaves it as is
+        'Vary': 'Accept-Encoding'
+    }
+    stream = generate()
+    
+    # Status events repeat the same keys, so they compress very well
+    if 'gzip' in request.accept_encodings:
+        stream = _gzip_stream(stream, app.config['COMPRESS_LEVEL'])
+        headers['Content-Encoding'] = 'gzip'
     
     return Response(
-        stream_with_context(generate()),
+        stream_with_context(stream),
         mimetype='text/event-stream',
-        headers={
-            'Cache-Control': 'no-cache',
-            'Connection': 'keep-alive',
-            'X-Accel-Buffering': 'no'  # Disable nginx buffering
-        }
+        headers=headers
     )
 
 
@@ -177,32 +456,24 @@ def api_scan():
     data = request.json
     repo_url = data.get('url', '').strip()
     
-    if not repo_url:
-        return jsonify({'error': 'Repository URL is required'}), 400
+    ok, error = _quick_validate(repo_url)
+    if not ok:
+        return jsonify({'error': error}), 400
     
     repo_info = get_repo_info(repo_url)
     
-    if repo_info['platform'] != 'GitHub':
-        return jsonify({'error': 'Currently only GitHub repositories are supported'}), 400
-    
-    if repo_info['owner'] == 'Unknown' or repo_info['name'] == 'Unknown':
-        return jsonify({'error': 'Invalid repository URL'}), 400
-    
     try:
         results = None
         
         # Process all events from the scanner
-        for event in scan_with_progress(repo_info['owner'], repo_info['name']):
-            event_data = json.loads(event.replace('data: ', '').strip())
-            
-            if event_data.get('type') == 'complete':
-                results = event_data['results']
-            elif event_data.get('type') == 'error':
-                return jsonify({'error': event_data['message']}), 400
+        for event in scan_with_progress(repo_info['owner'], repo_info['name'], repo_info):
+            if event['type'] == 'complete':
+                results = event['results']
+                break
+            elif event['type'] == 'error':
+                return jsonify({'error': event['message']}), 400
         
         if results:
-            results['repo_info'] = repo_info
-            results['scan_time'] = datetime.now().isoformat()
             return jsonify(results)
         else:
             return jsonify({'error': 'Scan failed'}), 500
@@ -229,12 +500,29 @@ def api_export_json():
     """
     data = request.json
     
-    response = Response(
-        json.dumps(data, indent=2),
-        mimetype='application/json',
-        headers={'Content-Disposition': 'attachment;filename=vulnerability-report.json'}
-    )
-    return response
+    def generate():
+        """Generator function for the JSON stream, one list item per chunk."""
+        if not isinstance(data, dict) or not data:
+            yield orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            return
+        
+        # Output is identical to orjson.dumps(data, option=OPT_INDENT_2);
+        # top-level keys keep their order and the two large lists are
+        # written item by item, each re-indented to its nesting depth
+        yield b'{'
+        for i, (key, value) in enumerate(data.items()):
+            yield (b',\n  ' if i else b'\n  ') + orjson.dumps(key) + b': '
+            
+            if key in _STREAMED_LISTS and isinstance(value, list) and value:
+                yield b'['
+                for j, item in enumerate(value):
+                    yield (b',\n    ' if j else b'\n    ') + _dumps_indented(item, b'\n    ')
+                yield b'\n  ]'
+            else:
+                yield _dumps_indented(value, b'\n  ')
+        yield b'\n}'
+    
+    return _download_response(generate(), 'application/json', 'vulnerability-report.json')
 
 
 @app.route('/api/export/csv', methods=['POST'])
@@ -251,35 +539,27 @@ def api_export_csv():
     data = request.json
     vulnerabilities = data.get('vulnerabilities', [])
     
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Write CSV header
-    writer.writerow([
-        'Package', 'Version', 'Ecosystem', 
-        'Vulnerability ID', 'CVE', 'Severity', 
-        'CVSS Score', 'Summary'
-    ])
-    
-    # Write vulnerability rows
-    for vuln in vulnerabilities:
-        writer.writerow([
-            vuln.get('package', ''),
-            vuln.get('version', ''),
-            vuln.get('ecosystem', ''),
-            vuln.get('id', ''),
-            vuln.get('cve', ''),
-            vuln.get('severity', ''),
-            vuln.get('cvss_score', ''),
-            vuln.get('summary', '')
-        ])
-    
-    response = Response(
-        output.getvalue(),
-        mimetype='text/csv',
-        headers={'Content-Disposition': 'attachment;filename=vulnerability-report.csv'}
-    )
-    return response
+    def generate():
+        """Generator function for the CSV stream, one row per chunk."""
+        writerow = csv.writer(_Echo()).writerow
+        
+        # Write CSV header
+        yield _CSV_HEADER_ROW
+        
+        # Write vulnerability rows
+        for vuln in vulnerabilities:
+            yield writerow([
+                vuln.get('package', ''),
+                vuln.get('version', ''),
+                vuln.get('ecosystem', ''),
+                vuln.get('id', ''),
+                vuln.get('cve', ''),
+                vuln.get('severity', ''),
+                vuln.get('cvss_score', ''),
+                vuln.get('summary', '')
+            ])
+    
+    return _download_response(generate(), 'text/csv', 'vulnerability-report.csv')
 
 
 # =============================================================================
@@ -295,6 +575,7 @@ if __name__ == '__main__':
     log("GitHub: https://github.com/elifsudeates/depshield")
     log("=" * 50)
     
-    # Run Flask development server
+    # Run Flask development server (production uses gunicorn.conf.py)
     # threaded=True enables concurrent request handling for SSE
-    app.run(debug=True, port=5000, threaded=True)
+    debug = os.getenv('FLASK_DEBUG', '').lower() in ('1', 'true')
+    app.run(debug=debug, port=5000, threaded=True)
@@ -12,8 +12,17 @@ License: MIT
 
 from .config import OSV_API, GITHUB_API
 from .logger import log
-from .github_client import get_github_file_content, get_repo_tree, get_repo_info
+from .cache import cache, osv_cache
+from .concurrency import set_io_executor, get_io_executor
+from .github_client import (
+    get_github_file_content,
+    get_repo_tree,
+    get_repo_tree_with_sha,
+    get_repo_info,
+    parse_repo_url
+)
 from .parsers import (
+    Dep,
     parse_package_json_content,
     parse_requirements_txt_content,
     parse_pipfile_content,
@@ -21,9 +30,11 @@ from .parsers import (
     parse_gemfile_lock_content,
     parse_go_mod_content,
     parse_composer_json_content,
+    parse_all,
+    clear_parser_caches,
     find_dependency_files_in_tree
 )
-from .scanner import check_vulnerability_osv, scan_with_progress
+from .scanner import check_vulnerability_osv, check_vulnerabilities_osv_batch, scan_with_progress
 
 __version__ = "1.0.0"
 __author__ = "Elif Sude ATES"
@@ -33,9 +44,16 @@ __all__ = [
     "OSV_API",
     "GITHUB_API",
     "log",
+    "cache",
+    "osv_cache",
+    "set_io_executor",
+    "get_io_executor",
     "get_github_file_content",
     "get_repo_tree",
+    "get_repo_tree_with_sha",
     "get_repo_info",
+    "parse_repo_url",
+    "Dep",
     "parse_package_json_content",
     "parse_requirements_txt_content",
     "parse_pipfile_content",
@@ -43,7 +61,10 @@ __all__ = [
     "parse_gemfile_lock_content",
     "parse_go_mod_content",
     "parse_composer_json_content",
+    "parse_all",
+    "clear_parser_caches",
     "find_dependency_files_in_tree",
     "check_vulnerability_osv",
+    "check_vulnerabilities_osv_batch",
     "scan_with_progress",
 ]
@@ -0,0 +1,66 @@
+"""
+Caching for DepShield
+=====================
+
+This module holds the shared Flask-Caching instances: `cache` memoizes
+GitHub API lookups and complete scan results, `osv_cache` holds OSV
+results per package version. Repeated scans of the same repository within
+the cache timeout are served from memory instead of spending GitHub rate
+limit on identical requests.
+
+OSV entries are small and numerous while GitHub entries are few and
+large, so they live in separate caches with their own size limits.
+
+The instances are unbound at import time; the Flask application binds
+them with `init_app(app, config=...)`. Library callers that never bind
+them simply run without caching.
+
+Author: Elif Sude ATES
+GitHub: https://github.com/elifsudeates/depshield
+"""
+
+from functools import wraps
+from typing import Any, Callable, Optional
+
+from flask_caching import Cache
+
+
+# Shared cache instances, bound to the Flask app in app.py
+cache = Cache()
+osv_cache = Cache()
+
+
+def cache_unbound(store: Cache = cache) -> bool:
+    """Tell whether no Flask app has been bound to a cache yet."""
+    return getattr(store, 'app', None) is None
+
+
+def memoize(timeout: int, response_filter: Optional[Callable[[Any], bool]] = None) -> Callable:
+    """
+    Memoize a function in the shared cache once an app has bound it.
+
+    Same as `cache.memoize`, except that calls made before init_app()
+    (DepShield used as a library) go straight to the function. Flask-Caching
+    itself needs a bound app even to skip caching.
+
+    Args:
+        timeout: Cache timeout in seconds
+        response_filter: Only results for which this returns True are cached
+
+    Example:
+        >>> @memoize(600)
+        ... def lookup(name):
+        ...     return name.upper()
+    """
+    def decorator(func: Callable) -> Callable:
+        memoized = cache.memoize(timeout, response_filter=response_filter)(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if cache_unbound():
+                return func(*args, **kwargs)
+            return memoized(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
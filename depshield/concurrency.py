@@ -0,0 +1,66 @@
+"""
+Shared I/O Executor for DepShield
+=================================
+
+This module owns the thread pool used to fan out network requests
+(OSV queries, GitHub downloads) during a scan. Sharing one bounded pool
+across all scans amortizes thread creation and caps the number of
+concurrent outbound requests, which keeps DepShield under GitHub's
+secondary rate limits.
+
+The web application installs a long-lived executor at startup with
+set_io_executor(). Library callers that never install one get a lazily
+created default pool.
+
+Author: Elif Sude ATES
+GitHub: https://github.com/elifsudeates/depshield
+"""
+
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Optional
+
+from .config import IO_MAX_WORKERS
+
+
+_io_executor: Optional[Executor] = None
+_io_executor_lock = threading.Lock()
+
+
+def set_io_executor(executor: Executor) -> None:
+    """
+    Install the executor used for parallel network requests.
+
+    The caller owns the executor's lifecycle (including shutdown).
+
+    Args:
+        executor: Executor to submit I/O-bound work to
+
+    Example:
+        >>> pool = ThreadPoolExecutor(max_workers=16)
+        >>> set_io_executor(pool)
+    """
+    global _io_executor
+    with _io_executor_lock:
+        _io_executor = executor
+
+
+def get_io_executor() -> Executor:
+    """
+    Get the executor used for parallel network requests.
+
+    Returns the executor installed with set_io_executor(), or creates a
+    default thread pool of IO_MAX_WORKERS threads on first use.
+
+    Returns:
+        Shared executor instance.
+    """
+    global _io_executor
+    if _io_executor is None:
+        with _io_executor_lock:
+            if _io_executor is None:
+                _io_executor = ThreadPoolExecutor(
+                    max_workers=IO_MAX_WORKERS,
+                    thread_name_prefix='depshield-io'
+                )
+    return _io_executor
@@ -25,6 +25,14 @@ load_dotenv()
 # Documentation: https://osv.dev/docs/
 OSV_API = "https://api.osv.dev/v1/query"
 
+# OSV batch query endpoint (returns only vulnerability IDs per query) and
+# the endpoint for full vulnerability records (/v1/vulns/{id})
+OSV_BATCH_API = "https://api.osv.dev/v1/querybatch"
+OSV_VULN_API = "https://api.osv.dev/v1/vulns"
+
+# Maximum number of queries OSV accepts in one batch request
+OSV_BATCH_SIZE = 1000
+
 # GitHub API base URL
 # Used for fetching repository contents without cloning
 # Documentation: https://docs.github.com/en/rest
@@ -109,6 +117,83 @@ OSV_TIMEOUT = 10
 REPO_INFO_TIMEOUT = 5
 
 
+# =============================================================================
+# CONCURRENCY
+# =============================================================================
+
+# Worker threads in the shared I/O pool used for OSV/GitHub fan-out
+# Kept moderate to stay under GitHub's secondary rate limits; raise it for
+# more in-flight OSV detail fetches on large scans
+IO_MAX_WORKERS = int(os.getenv("IO_MAX_WORKERS", "16"))
+
+# Minimum number of files before parse_all() uses a (spawned) process pool
+# Below this, process startup costs more than parsing a few manifests
+PARSE_PARALLEL_MIN_FILES = 32
+
+
+# =============================================================================
+# CACHING
+# =============================================================================
+
+# Flask-Caching backend type
+# "SimpleCache" keeps entries in process memory; use "RedisCache" together
+# with CACHE_REDIS_URL to share the cache between workers in production
+CACHE_TYPE = os.getenv("CACHE_TYPE", "SimpleCache")
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL")
+
+# Default cache timeout (in seconds)
+CACHE_DEFAULT_TIMEOUT = 300
+
+# Maximum number of entries in the in-memory cache (SimpleCache) for GitHub
+# lookups and scan results. These entries can be megabytes each (recursive
+# trees, full reports) and expired ones are only dropped once the cache is
+# full, so the limit is kept small
+CACHE_THRESHOLD = int(os.getenv("CACHE_THRESHOLD", "500"))
+
+# Maximum number of entries in the separate in-memory OSV result cache
+# Every package version of a scan takes one small entry, so this must be far
+# above the size of a large scan or entries are evicted before they are reused
+OSV_CACHE_THRESHOLD = int(os.getenv("OSV_CACHE_THRESHOLD", "50000"))
+
+# Cache timeout for repository metadata (in seconds)
+REPO_INFO_CACHE_TIMEOUT = 300
+
+# Cache timeout for repository file trees (in seconds)
+REPO_TREE_CACHE_TIMEOUT = 600
+
+# Cache timeout for downloaded dependency files (in seconds)
+FILE_CONTENT_CACHE_TIMEOUT = 600
+
+# Persistent HTTP cache for GitHub API responses (requests-cache, SQLite)
+# Survives restarts; stale entries are revalidated with ETags, and GitHub
+# does not count 304 Not Modified responses against the rate limit
+HTTP_CACHE_NAME = os.getenv("HTTP_CACHE_NAME", "depshield_http_cache")
+HTTP_CACHE_EXPIRE = 600
+
+# Cache timeout for OSV results per package version (in seconds)
+OSV_CACHE_TIMEOUT = 86400
+
+# Skip OSV cache lookups (fresh results are still stored), e.g. for CI
+OSV_CACHE_BYPASS = os.getenv("OSV_CACHE_BYPASS", "").lower() in ("1", "true")
+
+# Cache timeout for complete scan results per repository tree SHA (in seconds)
+# Kept short so rescans of an unchanged repository still pick up new CVEs
+SCAN_CACHE_TIMEOUT = 3600
+
+# Number of parsed dependency files kept per parser, keyed by file content
+# Unchanged manifests are not parsed again on repeated scans
+PARSE_CACHE_SIZE = 512
+
+
+# =============================================================================
+# DIAGNOSTICS
+# =============================================================================
+
+# Serve runtime metrics at /debug/stats (always on in Flask debug mode)
+# Off by default: the endpoint is unauthenticated
+DEBUG_STATS = os.getenv("DEBUG_STATS", "").lower() in ("1", "true")
+
+
 # =============================================================================
 # APPLICATION METADATA
 # =============================================================================
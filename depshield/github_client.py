@@ -17,24 +17,99 @@ GitHub: https://github.com/elifsudeates/depshield
 import re
 import base64
 import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Tuple, Optional, List, Dict, Any
 
-from .config import GITHUB_API, GITHUB_TIMEOUT, REPO_INFO_TIMEOUT, GITHUB_HEADERS
+from .cache import memoize
+from .config import (
+    GITHUB_API,
+    GITHUB_TIMEOUT,
+    REPO_INFO_TIMEOUT,
+    GITHUB_HEADERS,
+    REPO_INFO_CACHE_TIMEOUT,
+    REPO_TREE_CACHE_TIMEOUT,
+    FILE_CONTENT_CACHE_TIMEOUT,
+    HTTP_CACHE_NAME,
+    HTTP_CACHE_EXPIRE
+)
 from .logger import log
+from .metrics import record_http_response
 
 
+# Shared HTTP session for all GitHub API calls
+# Keep-alive connections are reused across the tree lookup and file downloads,
+# so only the first request of a scan pays for the TCP/TLS handshake.
+# Responses are cached on disk and revalidated with conditional requests.
+_SESSION = requests_cache.CachedSession(
+    HTTP_CACHE_NAME,
+    backend='sqlite',
+    expire_after=HTTP_CACHE_EXPIRE,
+    cache_control=True,
+    stale_if_error=True,
+    allowable_methods=('GET',)
+)
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+_SESSION.headers.update(GITHUB_HEADERS)
+
+# Regex pattern for GitHub URLs
+# Supports both HTTPS URLs and SSH-style URLs (git@github.com:...)
+_GH_URL_RE = re.compile(r'github\.com[/:]([^/]+)/([^/\.]+)')
+
+
+def _get(url: str, timeout: int) -> requests.Response:
+    """GET a GitHub API URL through the shared session, recording cache use."""
+    response = _SESSION.get(url, timeout=timeout)
+    record_http_response(response)
+    return response
+
+
+def _probe_urls(urls: List[str], timeout: int) -> Optional[Tuple[int, requests.Response]]:
+    """
+    Request candidate URLs in order until one succeeds.
+    
+    Candidates are tried one at a time, so the common case (the first
+    candidate exists) costs a single request against the GitHub rate limit.
+    
+    Args:
+        urls: Candidate URLs, most preferred first
+        timeout: Request timeout in seconds
+    
+    Returns:
+        Tuple of (index, response) for the first 200 response, or None.
+    """
+    for index, url in enumerate(urls):
+        response = _get(url, timeout)
+        if response.status_code == 200:
+            return index, response
+    return None
+
+
+def _is_success(result: Tuple[Any, Optional[str]]) -> bool:
+    """Only cache (value, error) results that did not fail."""
+    return result[1] is None
+
+
+@memoize(FILE_CONTENT_CACHE_TIMEOUT, response_filter=_is_success)
 def get_github_file_content(
     owner: str, 
     repo: str, 
     path: str, 
     branch: str = 'main'
-) -> Tuple[Optional[str], Optional[str]]:
+) -> Tuple[Optional[bytes], Optional[str]]:
     """
     Fetch a single file's content from a GitHub repository.
     
     This function retrieves the raw content of a file from a GitHub repository
-    using the Contents API. It automatically tries multiple branches if the
-    specified branch is not found.
+    using the Contents API, as bytes. The specified branch is tried first;
+    'main' and 'master' are only tried if it does not have the file, so
+    passing the branch resolved by get_repo_tree_with_sha() costs a single
+    request. Successful results are memoized.
     
     Args:
         owner: Repository owner (username or organization)
@@ -44,7 +119,7 @@ def get_github_file_content(
     
     Returns:
         Tuple of (content, error):
-        - On success: (file_content_string, None)
+        - On success: (file_content_bytes, None)
         - On failure: (None, error_message)
     
     Example:
@@ -56,20 +131,23 @@ def get_github_file_content(
     
     try:
         # Try multiple branch names in order of likelihood
-        branches_to_try = [branch, 'main', 'master']
+        # dict.fromkeys keeps the order while dropping duplicates
+        branches_to_try = list(dict.fromkeys([branch, 'main', 'master']))
+        urls = [
+            f"{GITHUB_API}/repos/{owner}/{repo}/contents/{path}?ref={branch_name}"
+            for branch_name in branches_to_try
+        ]
+        found = _probe_urls(urls, GITHUB_TIMEOUT)
         
-        for branch_name in branches_to_try:
-            url = f"{GITHUB_API}/repos/{owner}/{repo}/contents/{path}?ref={branch_name}"
-            response = requests.get(url, headers=GITHUB_HEADERS, timeout=GITHUB_TIMEOUT)
+        if found is not None:
+            data = found[1].json()
             
-            if response.status_code == 200:
-                data = response.json()
-                
-                # GitHub returns file content as base64 encoded string
-                if 'content' in data:
-                    content = base64.b64decode(data['content']).decode('utf-8')
-                    log(f"✓ Downloaded {path} ({len(content)} bytes)")
-                    return content, None
+            # GitHub returns file content as base64 encoded string
+            # Raw bytes are returned; parsers decode only when they need text
+            if 'content' in data:
+                content = base64.b64decode(data['content'])
+                log(f"✓ Downloaded {path} ({len(content)} bytes)")
+                return content, None
         
         # File not found in any branch
         log(f"✗ File not found: {path}", "WARN")
@@ -88,50 +166,58 @@ def get_github_file_content(
         return None, str(e)
 
 
-def get_repo_tree(owner: str, repo: str) -> Tuple[Optional[List[str]], Optional[str]]:
+@memoize(REPO_TREE_CACHE_TIMEOUT, response_filter=_is_success)
+def get_repo_tree_with_sha(owner: str, repo: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
     """
-    Fetch the complete file tree of a GitHub repository.
+    Fetch the complete file tree of a GitHub repository and its tree SHA.
     
     Uses the Git Trees API with recursive=1 to get all files in a single request.
     This is much more efficient than making individual requests for each file.
+    The 'main' branch is tried first, then 'master'. The tree SHA changes
+    whenever any file changes, so it identifies the repository contents.
+    Successful results are memoized.
     
     Args:
         owner: Repository owner (username or organization)
         repo: Repository name
     
     Returns:
-        Tuple of (file_list, error):
-        - On success: (list_of_file_paths, None)
+        Tuple of (tree, error):
+        - On success: ({'sha': tree_sha, 'branch': branch_name,
+          'files': list_of_file_paths}, None)
         - On failure: (None, error_message)
     
     Example:
-        >>> files, error = get_repo_tree("expressjs", "express")
-        >>> if files:
-        ...     print(f"Found {len(files)} files")
+        >>> tree, error = get_repo_tree_with_sha("expressjs", "express")
+        >>> if tree:
+        ...     print(f"Found {len(tree['files'])} files at {tree['sha'][:7]}")
     """
     log(f"Fetching repository tree for {owner}/{repo}...")
     
     try:
         # Try common default branch names
-        for branch in ['main', 'master']:
-            url = f"{GITHUB_API}/repos/{owner}/{repo}/git/trees/{branch}?recursive=1"
-            log(f"Trying branch: {branch}")
+        branches = ['main', 'master']
+        log(f"Trying branches: {', '.join(branches)}")
+        urls = [
+            f"{GITHUB_API}/repos/{owner}/{repo}/git/trees/{branch}?recursive=1"
+            for branch in branches
+        ]
+        found = _probe_urls(urls, GITHUB_TIMEOUT)
+        
+        if found is not None:
+            index, response = found
+            data = response.json()
             
-            response = requests.get(url, headers=GITHUB_HEADERS, timeout=GITHUB_TIMEOUT)
+            # Extract only file paths (not directories)
+            # 'blob' type indicates a file, 'tree' indicates a directory
+            files = [
+                item['path'] 
+                for item in data.get('tree', []) 
+                if item['type'] == 'blob'
+            ]
             
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Extract only file paths (not directories)
-                # 'blob' type indicates a file, 'tree' indicates a directory
-                files = [
-                    item['path'] 
-                    for item in data.get('tree', []) 
-                    if item['type'] == 'blob'
-                ]
-                
-                log(f"✓ Found {len(files)} files in repository")
-                return files, None
+            log(f"✓ Found {len(files)} files in repository")
+            return {'sha': data.get('sha'), 'branch': branches[index], 'files': files}, None
         
         # Could not find valid branch
         log("✗ Could not fetch repository tree", "ERROR")
@@ -150,12 +236,98 @@ def get_repo_tree(owner: str, repo: str) -> Tuple[Optional[List[str]], Optional[
         return None, str(e)
 
 
+def get_repo_tree(owner: str, repo: str) -> Tuple[Optional[List[str]], Optional[str]]:
+    """
+    Fetch the complete file tree of a GitHub repository.
+    
+    Same as get_repo_tree_with_sha(), without the tree SHA.
+    
+    Args:
+        owner: Repository owner (username or organization)
+        repo: Repository name
+    
+    Returns:
+        Tuple of (file_list, error):
+        - On success: (list_of_file_paths, None)
+        - On failure: (None, error_message)
+    
+    Example:
+        >>> files, error = get_repo_tree("expressjs", "express")
+        >>> if files:
+        ...     print(f"Found {len(files)} files")
+    """
+    tree, error = get_repo_tree_with_sha(owner, repo)
+    return (tree['files'] if tree else None), error
+
+
+def parse_repo_url(repo_url: str) -> Optional[Tuple[str, str]]:
+    """
+    Extract owner and repository name from a GitHub URL.
+    
+    Pure string parsing, no network access. Supports both HTTPS URLs and
+    SSH-style URLs (git@github.com:...).
+    
+    Args:
+        repo_url: Full URL to the GitHub repository
+    
+    Returns:
+        Tuple of (owner, name), or None if this is not a GitHub URL.
+    
+    Example:
+        >>> parse_repo_url("https://github.com/expressjs/express")
+        ('expressjs', 'express')
+    """
+    match = _GH_URL_RE.search(repo_url)
+    if not match:
+        return None
+    return match.group(1), match.group(2).replace('.git', '')
+
+
+@memoize(REPO_INFO_CACHE_TIMEOUT, response_filter=_is_success)
+def _fetch_repo_metadata(owner: str, name: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Fetch description, stars, language and avatar of a GitHub repository.
+    
+    Successful results are memoized; failures (timeouts, rate limiting)
+    are not, so the next request tries again.
+    
+    Args:
+        owner: Repository owner (username or organization)
+        name: Repository name
+    
+    Returns:
+        Tuple of (metadata, error):
+        - On success: (dict with description/stars/language/avatar, None)
+        - On failure: (None, error_message)
+    """
+    try:
+        api_url = f"{GITHUB_API}/repos/{owner}/{name}"
+        response = _get(api_url, REPO_INFO_TIMEOUT)
+        
+        if response.status_code != 200:
+            return None, f"HTTP {response.status_code}"
+        
+        data = response.json()
+        return {
+            'description': data.get('description', '') or '',
+            'stars': data.get('stargazers_count', 0),
+            'language': data.get('language', '') or '',
+            'avatar': data.get('owner', {}).get('avatar_url', '')
+        }, None
+        
+    except requests.exceptions.RequestException as e:
+        return None, str(e)
+    except Exception as e:
+        return None, str(e)
+
+
 def get_repo_info(repo_url: str) -> Dict[str, Any]:
     """
     Extract repository information from a GitHub repository URL.
     
     Parses the URL to extract owner and repository name, then fetches
-    additional metadata from the GitHub API.
+    additional metadata from the GitHub API. Successful metadata lookups
+    are memoized.
     
     Note: Currently only GitHub repositories are supported.
     
@@ -192,32 +364,16 @@ def get_repo_info(repo_url: str) -> Dict[str, Any]:
         'avatar': ''
     }
     
-    # Regex pattern for GitHub URLs
-    # Supports both HTTPS URLs and SSH-style URLs (git@github.com:...)
-    pattern = r'github\.com[/:]([^/]+)/([^/\.]+)'
-    match = re.search(pattern, repo_url)
+    parsed = parse_repo_url(repo_url)
     
-    if match:
-        info['owner'] = match.group(1)
-        info['name'] = match.group(2).replace('.git', '')
+    if parsed:
+        info['owner'], info['name'] = parsed
         info['platform'] = 'GitHub'
         
         # Fetch additional metadata from GitHub API
-        try:
-            api_url = f"{GITHUB_API}/repos/{info['owner']}/{info['name']}"
-            response = requests.get(api_url, headers=GITHUB_HEADERS, timeout=REPO_INFO_TIMEOUT)
-            
-            if response.status_code == 200:
-                data = response.json()
-                info['description'] = data.get('description', '') or ''
-                info['stars'] = data.get('stargazers_count', 0)
-                info['language'] = data.get('language', '') or ''
-                info['avatar'] = data.get('owner', {}).get('avatar_url', '')
-                
-        except requests.exceptions.RequestException:
-            # Silently fail - we already have basic info from URL
-            pass
-        except Exception:
-            pass
+        # On failure we silently keep the basic info from the URL
+        metadata, _ = _fetch_repo_metadata(info['owner'], info['name'])
+        if metadata:
+            info.update(metadata)
     
     return info
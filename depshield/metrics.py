@@ -0,0 +1,118 @@
+"""
+Runtime Metrics for DepShield
+=============================
+
+This module keeps lightweight in-process metrics used to see where scan
+time goes: route latencies, SSE event intervals and HTTP cache hit
+rates. Only a rolling window of recent samples is kept, so memory use is
+bounded regardless of uptime.
+
+The metrics are exposed by the /debug/stats endpoint in app.py. They are
+updated from request, I/O pool and scan threads, so every collection is
+guarded by a lock.
+
+Author: Elif Sude ATES
+GitHub: https://github.com/elifsudeates/depshield
+"""
+
+import threading
+from collections import Counter, defaultdict, deque
+from typing import Any, Dict
+
+
+class RollingWindow:
+    """
+    Fixed-size window of recent samples with percentile summaries.
+
+    Args:
+        size: Maximum number of samples kept (oldest are discarded)
+
+    Example:
+        >>> window = RollingWindow()
+        >>> window.add(0.120)
+        >>> window.summary()['p50_ms']
+        120.0
+    """
+
+    def __init__(self, size: int = 1000) -> None:
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float) -> None:
+        """Record one sample, in seconds."""
+        with self._lock:
+            self._samples.append(seconds)
+
+    def summary(self) -> Dict[str, Any]:
+        """Return sample count and p50/p95 in milliseconds."""
+        with self._lock:
+            samples = sorted(self._samples)
+
+        if not samples:
+            return {'count': 0, 'p50_ms': None, 'p95_ms': None}
+
+        def percentile(p: float) -> float:
+            index = min(len(samples) - 1, int(p * len(samples)))
+            return round(samples[index] * 1000, 1)
+
+        return {
+            'count': len(samples),
+            'p50_ms': percentile(0.50),
+            'p95_ms': percentile(0.95)
+        }
+
+
+# Request latency per Flask endpoint
+ROUTE_LATENCY = defaultdict(RollingWindow)
+_ROUTE_LATENCY_LOCK = threading.Lock()
+
+# Time between consecutive events of a scan stream
+SSE_EVENT_INTERVALS = RollingWindow()
+
+# GitHub HTTP cache outcomes ('hits' / 'misses')
+HTTP_CACHE = Counter()
+_HTTP_CACHE_LOCK = threading.Lock()
+
+
+def record_route_latency(endpoint: str, seconds: float) -> None:
+    """
+    Record the latency of one request.
+
+    Args:
+        endpoint: Flask endpoint name
+        seconds: Request latency in seconds
+    """
+    with _ROUTE_LATENCY_LOCK:
+        window = ROUTE_LATENCY[endpoint]
+    window.add(seconds)
+
+
+def route_latency_summary() -> Dict[str, Any]:
+    """Return p50/p95 latency per endpoint."""
+    with _ROUTE_LATENCY_LOCK:
+        windows = list(ROUTE_LATENCY.items())
+    return {endpoint: window.summary() for endpoint, window in windows}
+
+
+def record_http_response(response: Any) -> None:
+    """
+    Count whether a GitHub API response was served from the HTTP cache.
+
+    Args:
+        response: Response returned by the cached session
+    """
+    outcome = 'hits' if getattr(response, 'from_cache', False) else 'misses'
+    with _HTTP_CACHE_LOCK:
+        HTTP_CACHE[outcome] += 1
+
+
+def http_cache_summary() -> Dict[str, Any]:
+    """Return HTTP cache hit/miss counts and hit ratio."""
+    with _HTTP_CACHE_LOCK:
+        hits, misses = HTTP_CACHE['hits'], HTTP_CACHE['misses']
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / total, 3) if total else None
+    }
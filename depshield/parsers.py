@@ -19,15 +19,296 @@ Author: Elif Sude ATES
 GitHub: https://github.com/elifsudeates/depshield
 """
 
-import json
+import os
 import re
-from typing import List, Dict, Any, Tuple
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing import get_context
+from typing import List, Dict, Any, Callable, Iterable, Iterator, NamedTuple, Tuple, Union
 
-from .config import DEPENDENCY_FILES, SKIP_DIRECTORIES
+import orjson
+
+from .config import (
+    DEPENDENCY_FILES,
+    SKIP_DIRECTORIES,
+    PARSE_PARALLEL_MIN_FILES,
+    PARSE_CACHE_SIZE
+)
 from .logger import log
 
 
-def parse_package_json_content(content: str) -> List[Dict[str, str]]:
+# =============================================================================
+# LAZY IMPORTS
+# =============================================================================
+# TOML and PEP 508 parsing are only needed for Python manifests, so their
+# modules are imported on first use instead of with this module.
+
+_toml = None
+_requirement = None  # packaging's Requirement class, or False if unavailable
+
+
+def _get_toml() -> Any:
+    """Return the TOML module: stdlib tomllib on 3.11+, tomli before that."""
+    global _toml
+    if _toml is None:
+        try:
+            import tomllib as toml
+        except ImportError:
+            import tomli as toml
+        _toml = toml
+    return _toml
+
+
+def _get_requirement() -> Any:
+    """Return packaging's Requirement class, or None if it is not installed."""
+    global _requirement
+    if _requirement is None:
+        try:
+            from packaging.requirements import Requirement
+            _requirement = Requirement
+        except ImportError:
+            _requirement = False
+    return _requirement or None
+
+
+# =============================================================================
+# DEPENDENCY RECORD
+# =============================================================================
+
+class Dep(NamedTuple):
+    """
+    A single dependency extracted from a manifest file.
+    
+    Tuples are much smaller than dicts with the same four keys, which
+    matters on large monorepos. Use `_asdict()` where a JSON object is needed.
+    
+    Attributes:
+        name: Package name
+        version: Version string (cleaned of range operators)
+        type: Dependency type (dependencies, devDependencies, etc.)
+        ecosystem: OSV ecosystem name (npm, PyPI, Go, etc.)
+    """
+    name: str
+    version: str
+    type: str
+    ecosystem: str
+
+
+# =============================================================================
+# COMPILED PATTERNS
+# =============================================================================
+# Compiled once at import instead of being looked up in the re module's
+# cache on every call.
+
+# Gemfile.lock spec entry: 4 spaces indent, name (version) format
+_GEMFILE_SPEC_RE = re.compile(r'^\s{4}([a-zA-Z0-9_-]+)\s+\(([^)]+)\)')
+
+# Any of the skipped directories, matched in a single scan of the path
+_SKIP_RE = re.compile('|'.join(re.escape(skip_dir) for skip_dir in SKIP_DIRECTORIES))
+
+
+# =============================================================================
+# DEPENDENCY SECTIONS
+# =============================================================================
+
+# All possible dependency sections in package.json
+_NPM_DEP_TYPES = ('dependencies', 'devDependencies', 'peerDependencies', 'optionalDependencies')
+
+# Regular and dev packages in Pipfile
+_PIPFILE_DEP_TYPES = ('packages', 'dev-packages')
+
+# Poetry sections in pyproject.toml ([tool.poetry.*])
+_POETRY_DEP_TYPES = ('dependencies', 'dev-dependencies')
+
+# Runtime and dev requirements in composer.json
+_COMPOSER_DEP_TYPES = ('require', 'require-dev')
+
+# Known dependency filenames, for O(1) membership checks
+_DEP_FILES = frozenset(DEPENDENCY_FILES)
+
+# Range operators stripped from the front of version strings (^, ~, >=, etc.)
+_VERSION_PREFIX = '^~>=<'
+
+# Characters that end the package name in a requirements.txt line
+_NAME_TERMS = frozenset('=<>!~;[@# \t')
+
+# Operator preference when a PEP 508 range is reduced to one version:
+# exact pins first, then lower bounds (a SpecifierSet has no order)
+_SPECIFIER_PRIORITY = ('===', '==', '~=', '>=', '>', '<=', '<', '!=')
+
+
+def _emit_pep508(deps: List[str], dep_type: str, out: List[Dep]) -> None:
+    """
+    Parse PEP 508 dependency strings and append them to a list.
+    
+    Uses packaging's requirement parser when it is installed, which
+    handles extras and environment markers correctly, and the linear
+    _split_requirement() scan otherwise. Only one version constraint is
+    kept; dependencies without a version get 'latest'. Unrecognized
+    strings are skipped.
+    
+    Args:
+        deps: Dependency strings, e.g. ["flask>=2.0,<3", "click[extra]==7.0"]
+        dep_type: Dependency type recorded on each Dep
+        out: List the parsed Dep tuples are appended to
+    
+    Example:
+        >>> out = []
+        >>> _emit_pep508(["flask>=2.0,<3"], 'dependencies', out)
+        >>> out[0].version
+        '2.0'
+    """
+    Requirement = _get_requirement()
+    append = out.append
+    
+    for dep in deps:
+        if Requirement is not None:
+            try:
+                requirement = Requirement(dep)
+            except ValueError:  # InvalidRequirement
+                pass  # Fall back to the scan below
+            else:
+                version = _pick_specifier_version(requirement.specifier)
+                append(Dep(requirement.name, version, dep_type, 'PyPI'))
+                continue
+        
+        name, version = _split_requirement(dep.strip())
+        if name:
+            append(Dep(name, version, dep_type, 'PyPI'))
+
+
+def _pick_specifier_version(specifier: Any) -> str:
+    """
+    Reduce a packaging SpecifierSet to a single version string.
+    
+    Args:
+        specifier: SpecifierSet of a parsed requirement
+    
+    Returns:
+        Version of the preferred specifier, or 'latest' if there is none.
+    
+    Example:
+        >>> _pick_specifier_version(SpecifierSet("<2,>=1.0"))
+        '1.0'
+    """
+    versions = {spec.operator: spec.version for spec in specifier}
+    for operator in _SPECIFIER_PRIORITY:
+        if operator in versions:
+            return versions[operator]
+    return 'latest'
+
+
+def _to_text(content: Union[str, bytes]) -> str:
+    """Decode raw file bytes as UTF-8; str content is returned unchanged."""
+    return content.decode('utf-8') if isinstance(content, bytes) else content
+
+
+def _gemfile_spec_lines(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Yield the lines inside the 'specs:' sections of a Gemfile.lock.
+    
+    A section ends at the first line that does not start with a space.
+    
+    Args:
+        lines: Lines of the Gemfile.lock
+    
+    Yields:
+        Indented lines following each 'specs:' line.
+    """
+    in_specs = False
+    
+    for line in lines:
+        # Look for specs: section
+        if 'specs:' in line:
+            in_specs = True
+        elif in_specs:
+            # End of specs section (line doesn't start with space)
+            if line and not line.startswith(' '):
+                in_specs = False
+            else:
+                yield line
+
+
+def _split_requirement(line: str) -> Tuple[str, str]:
+    """
+    Split a requirement line (requirements.txt or PEP 508) into name and version.
+    
+    A single left-to-right scan finds the end of the name; extras,
+    environment markers and trailing comments are dropped, and only the
+    first version constraint is kept. Runs in linear time on any input.
+    
+    Args:
+        line: Stripped requirement line, e.g. "requests[socks]>=2.25,<3"
+    
+    Returns:
+        Tuple of (name, version); version is 'latest' if unpinned and
+        name is empty if the line does not start with a package name.
+    
+    Example:
+        >>> _split_requirement("requests[socks]>=2.25,<3")
+        ('requests', '2.25')
+    """
+    for i, char in enumerate(line):
+        if char in _NAME_TERMS:
+            break
+    else:
+        return line, 'latest'
+    
+    name, rest = line[:i], line[i:].lstrip()
+    
+    # Drop extras ("[socks]")
+    if rest.startswith('['):
+        rest = rest.partition(']')[2]
+    
+    # Direct references ("name @ https://...") carry no version
+    if rest.startswith('@'):
+        return name, 'latest'
+    
+    # Cut environment markers and comments, then keep the first constraint
+    rest = rest.partition(';')[0].partition('#')[0].partition(',')[0]
+    version = rest.strip().lstrip('=<>!~').strip()
+    
+    return name, version or 'latest'
+
+
+# =============================================================================
+# PARSE CACHE
+# =============================================================================
+
+# Cached parser functions, so clear_parser_caches() can reach them all
+_CACHED_PARSERS = []
+
+
+def _cached_parser(
+    parser: Callable[[Union[str, bytes]], Tuple[Dep, ...]]
+) -> Callable[[Union[str, bytes]], Tuple[Dep, ...]]:
+    """
+    Memoize a parser by file content.
+    
+    The same manifest is often parsed again on repeated scans of a
+    repository. Parsers return tuples so that callers cannot modify a
+    cached value.
+    
+    Args:
+        parser: Parser function taking the raw file content
+    
+    Returns:
+        Cached parser.
+    """
+    cached = lru_cache(maxsize=PARSE_CACHE_SIZE)(parser)
+    _CACHED_PARSERS.append(cached)
+    return cached
+
+
+def clear_parser_caches() -> None:
+    """Drop all memoized parse results."""
+    for cached in _CACHED_PARSERS:
+        cached.cache_clear()
+
+
+@_cached_parser
+def parse_package_json_content(content: Union[str, bytes]) -> Tuple[Dep, ...]:
     """
     Parse package.json content and extract npm dependencies.
     
@@ -38,10 +319,10 @@ def parse_package_json_content(content: str) -> List[Dict[str, str]]:
     - optionalDependencies
     
     Args:
-        content: Raw JSON content of package.json
+        content: Raw JSON content of package.json (bytes are parsed without decoding)
     
     Returns:
-        List of dependency dictionaries with keys:
+        Tuple of Dep with fields:
         - name: Package name
         - version: Version string (cleaned of range operators)
         - type: Dependency type (dependencies, devDependencies, etc.)
@@ -50,41 +331,38 @@ def parse_package_json_content(content: str) -> List[Dict[str, str]]:
     Example:
         >>> deps = parse_package_json_content('{"dependencies": {"express": "^4.17.1"}}')
         >>> deps[0]
-        {'name': 'express', 'version': '4.17.1', 'type': 'dependencies', 'ecosystem': 'npm'}
+        Dep(name='express', version='4.17.1', type='dependencies', ecosystem='npm')
     """
     dependencies = []
     
     try:
-        data = json.loads(content)
+        data = orjson.loads(content)
+        append = dependencies.append
         
-        # All possible dependency sections in package.json
-        dep_types = ['dependencies', 'devDependencies', 'peerDependencies', 'optionalDependencies']
-        
-        for dep_type in dep_types:
-            if dep_type in data:
-                for name, version in data[dep_type].items():
-                    # Clean version string - remove range operators (^, ~, >=, etc.)
-                    clean_version = re.sub(r'^[\^~>=<]', '', str(version))
-                    clean_version = clean_version.split(' ')[0]  # Take first part if range
-                    
-                    dependencies.append({
-                        'name': name,
-                        'version': clean_version,
-                        'type': dep_type,
-                        'ecosystem': 'npm'
-                    })
+        for dep_type in _NPM_DEP_TYPES:
+            section = data.get(dep_type)
+            if not section:
+                continue
+            
+            for name, version in section.items():
+                # Clean version string - remove range operators (^, ~, >=, etc.)
+                # Take first part if range
+                clean_version = str(version).lstrip(_VERSION_PREFIX).partition(' ')[0]
+                
+                append(Dep(name, clean_version, dep_type, 'npm'))
         
         log(f"  Parsed {len(dependencies)} npm dependencies")
         
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         log(f"  Error parsing package.json: Invalid JSON - {e}", "ERROR")
     except Exception as e:
         log(f"  Error parsing package.json: {e}", "ERROR")
     
-    return dependencies
+    return tuple(dependencies)
 
 
-def parse_requirements_txt_content(content: str) -> List[Dict[str, str]]:
+@_cached_parser
+def parse_requirements_txt_content(content: Union[str, bytes]) -> Tuple[Dep, ...]:
     """
     Parse requirements.txt content and extract Python dependencies.
     
@@ -96,10 +374,10 @@ def parse_requirements_txt_content(content: str) -> List[Dict[str, str]]:
     - Flags: -r, -e (ignored)
     
     Args:
-        content: Raw content of requirements.txt
+        content: Raw content of requirements.txt (bytes or str)
     
     Returns:
-        List of dependency dictionaries for PyPI ecosystem.
+        Tuple of Dep for PyPI ecosystem.
     
     Example:
         >>> deps = parse_requirements_txt_content("flask==2.0.0\\nrequests>=2.25.0")
@@ -109,57 +387,46 @@ def parse_requirements_txt_content(content: str) -> List[Dict[str, str]]:
     dependencies = []
     
     try:
-        for line in content.split('\n'):
-            line = line.strip()
-            
-            # Skip empty lines, comments, and pip flags
-            if not line or line.startswith('#') or line.startswith('-'):
-                continue
-            
-            # Parse package name and optional version
-            # Matches: package, package==1.0, package>=1.0, etc.
-            match = re.match(r'^([a-zA-Z0-9_-]+)([=<>!]+)?(.+)?$', line)
-            
-            if match:
-                name = match.group(1)
-                version = match.group(3) if match.group(3) else 'latest'
-                version = version.split(',')[0].strip()  # Take first constraint
-                
-                dependencies.append({
-                    'name': name,
-                    'version': version,
-                    'type': 'dependencies',
-                    'ecosystem': 'PyPI'
-                })
+        lines = (line.strip() for line in _to_text(content).splitlines())
+        
+        # Parse package name and optional version, skipping empty lines,
+        # comments, and pip flags
+        entries = [_split_requirement(line) for line in lines if line and line[0] not in '#-']
+        
+        dependencies = [
+            Dep(name, version, 'dependencies', 'PyPI')
+            for name, version in entries
+            if name
+        ]
         
         log(f"  Parsed {len(dependencies)} PyPI dependencies")
         
     except Exception as e:
         log(f"  Error parsing requirements.txt: {e}", "ERROR")
     
-    return dependencies
+    return tuple(dependencies)
 
 
-def parse_pipfile_content(content: str) -> List[Dict[str, str]]:
+@_cached_parser
+def parse_pipfile_content(content: Union[str, bytes]) -> Tuple[Dep, ...]:
     """
     Parse Pipfile content and extract Python dependencies.
     
     Pipfile uses TOML format with [packages] and [dev-packages] sections.
     
     Args:
-        content: Raw TOML content of Pipfile
+        content: Raw TOML content of Pipfile (bytes or str)
     
     Returns:
-        List of dependency dictionaries for PyPI ecosystem.
+        Tuple of Dep for PyPI ecosystem.
     """
     dependencies = []
     
     try:
-        import toml
-        data = toml.loads(content)
+        data = _get_toml().loads(_to_text(content))
         
         # Parse both regular and dev packages
-        for dep_type in ['packages', 'dev-packages']:
+        for dep_type in _PIPFILE_DEP_TYPES:
             if dep_type in data:
                 for name, version in data[dep_type].items():
                     # Version can be a string or a dict with version key
@@ -167,26 +434,20 @@ def parse_pipfile_content(content: str) -> List[Dict[str, str]]:
                         version = version.get('version', '*')
                     
                     # Clean version string
-                    version = str(version).replace('*', 'latest').replace('==', '').replace('>=', '')
+                    version = str(version).lstrip(_VERSION_PREFIX).replace('*', 'latest')
                     
-                    dependencies.append({
-                        'name': name,
-                        'version': version,
-                        'type': dep_type,
-                        'ecosystem': 'PyPI'
-                    })
+                    dependencies.append(Dep(name, version, dep_type, 'PyPI'))
         
         log(f"  Parsed {len(dependencies)} PyPI dependencies from Pipfile")
         
-    except ImportError:
-        log("  Error: toml package not installed", "ERROR")
     except Exception as e:
         log(f"  Error parsing Pipfile: {e}", "ERROR")
     
-    return dependencies
+    return tuple(dependencies)
 
 
-def parse_pyproject_toml_content(content: str) -> List[Dict[str, str]]:
+@_cached_parser
+def parse_pyproject_toml_content(content: Union[str, bytes]) -> Tuple[Dep, ...]:
     """
     Parse pyproject.toml content and extract Python dependencies.
     
@@ -196,16 +457,15 @@ def parse_pyproject_toml_content(content: str) -> List[Dict[str, str]]:
     - Poetry format ([tool.poetry.dependencies])
     
     Args:
-        content: Raw TOML content of pyproject.toml
+        content: Raw TOML content of pyproject.toml (bytes or str)
     
     Returns:
-        List of dependency dictionaries for PyPI ecosystem.
+        Tuple of Dep for PyPI ecosystem.
     """
     dependencies = []
     
     try:
-        import toml
-        data = toml.loads(content)
+        data = _get_toml().loads(_to_text(content))
         
         # ---------------------------------------------------------------------
         # Parse PEP 517/518 build-system requirements
@@ -213,21 +473,7 @@ def parse_pyproject_toml_content(content: str) -> List[Dict[str, str]]:
         #          requires = ["meson-python>=0.18.0", "Cython>=3.0.6"]
         # ---------------------------------------------------------------------
         if 'build-system' in data and 'requires' in data['build-system']:
-            for dep in data['build-system']['requires']:
-                # Parse dependency string: "package>=version" or "package[extra]>=version"
-                match = re.match(r'^([a-zA-Z0-9_-]+)(?:\[[^\]]+\])?([=<>!~]+)?(.+)?$', dep)
-                if match:
-                    name = match.group(1)
-                    version = match.group(3) if match.group(3) else 'latest'
-                    # Clean version - remove trailing constraints after comma
-                    version = version.split(',')[0].strip()
-                    
-                    dependencies.append({
-                        'name': name,
-                        'version': version,
-                        'type': 'build-requires',
-                        'ecosystem': 'PyPI'
-                    })
+            _emit_pep508(data['build-system']['requires'], 'build-requires', dependencies)
         
         # ---------------------------------------------------------------------
         # Parse Poetry format
@@ -237,7 +483,7 @@ def parse_pyproject_toml_content(content: str) -> List[Dict[str, str]]:
         if 'tool' in data and 'poetry' in data['tool']:
             poetry = data['tool']['poetry']
             
-            for dep_type in ['dependencies', 'dev-dependencies']:
+            for dep_type in _POETRY_DEP_TYPES:
                 if dep_type in poetry:
                     for name, version in poetry[dep_type].items():
                         # Skip Python version specification
@@ -248,15 +494,12 @@ def parse_pyproject_toml_content(content: str) -> List[Dict[str, str]]:
                         if isinstance(version, dict):
                             version = version.get('version', '*')
                         
-                        # Clean version string
-                        version = str(version).replace('^', '').replace('~', '').replace('*', 'latest')
+                        # Clean version string; the TOML parser already gives
+                        # structured data, so no pattern matching is needed
+                        version = str(version)
+                        version = 'latest' if version == '*' else version.lstrip('^~')
                         
-                        dependencies.append({
-                            'name': name,
-                            'version': version,
-                            'type': dep_type,
-                            'ecosystem': 'PyPI'
-                        })
+                        dependencies.append(Dep(name, version, dep_type, 'PyPI'))
         
         # ---------------------------------------------------------------------
         # Parse PEP 621 format
@@ -268,46 +511,26 @@ def parse_pyproject_toml_content(content: str) -> List[Dict[str, str]]:
             
             # Main dependencies
             if 'dependencies' in project:
-                for dep in project['dependencies']:
-                    match = re.match(r'^([a-zA-Z0-9_-]+)(?:\[[^\]]+\])?([=<>!~]+)?(.+)?$', dep)
-                    if match:
-                        name = match.group(1)
-                        version = match.group(3) if match.group(3) else 'latest'
-                        
-                        dependencies.append({
-                            'name': name,
-                            'version': version.split(',')[0].strip(),
-                            'type': 'dependencies',
-                            'ecosystem': 'PyPI'
-                        })
+                _emit_pep508(project['dependencies'], 'dependencies', dependencies)
             
             # Optional dependencies (extras)
             if 'optional-dependencies' in project:
                 for group_name, deps in project['optional-dependencies'].items():
-                    for dep in deps:
-                        match = re.match(r'^([a-zA-Z0-9_-]+)(?:\[[^\]]+\])?([=<>!~]+)?(.+)?$', dep)
-                        if match:
-                            name = match.group(1)
-                            version = match.group(3) if match.group(3) else 'latest'
-                            
-                            dependencies.append({
-                                'name': name,
-                                'version': version.split(',')[0].strip(),
-                                'type': f'optional-{group_name}',
-                                'ecosystem': 'PyPI'
-                            })
+                    # Built at runtime, so intern it to share one string
+                    # across all Dep tuples of the group
+                    dep_type = sys.intern(f'optional-{group_name}')
+                    _emit_pep508(deps, dep_type, dependencies)
         
         log(f"  Parsed {len(dependencies)} PyPI dependencies from pyproject.toml")
         
-    except ImportError:
-        log("  Error: toml package not installed", "ERROR")
     except Exception as e:
         log(f"  Error parsing pyproject.toml: {e}", "ERROR")
     
-    return dependencies
+    return tuple(dependencies)
 
 
-def parse_gemfile_lock_content(content: str) -> List[Dict[str, str]]:
+@_cached_parser
+def parse_gemfile_lock_content(content: Union[str, bytes]) -> Tuple[Dep, ...]:
     """
     Parse Gemfile.lock content and extract Ruby dependencies.
     
@@ -315,47 +538,34 @@ def parse_gemfile_lock_content(content: str) -> List[Dict[str, str]]:
     under the 'specs:' section with 4-space indentation.
     
     Args:
-        content: Raw content of Gemfile.lock
+        content: Raw content of Gemfile.lock (bytes or str)
     
     Returns:
-        List of dependency dictionaries for RubyGems ecosystem.
+        Tuple of Dep for RubyGems ecosystem.
     """
     dependencies = []
     
     try:
-        in_specs = False
+        match_spec = _GEMFILE_SPEC_RE.match  # Bound once for the loop
+        lines = _gemfile_spec_lines(_to_text(content).splitlines())
         
-        for line in content.split('\n'):
-            # Look for specs: section
-            if 'specs:' in line:
-                in_specs = True
-                continue
-            
-            if in_specs:
-                # End of specs section (line doesn't start with space)
-                if line and not line.startswith(' '):
-                    in_specs = False
-                    continue
-                
-                # Parse gem entries (4 spaces indent, name (version) format)
-                match = re.match(r'^\s{4}([a-zA-Z0-9_-]+)\s+\(([^)]+)\)', line)
-                if match:
-                    dependencies.append({
-                        'name': match.group(1),
-                        'version': match.group(2),
-                        'type': 'dependencies',
-                        'ecosystem': 'RubyGems'
-                    })
+        # Parse gem entries
+        dependencies = [
+            Dep(match.group(1), match.group(2), 'dependencies', 'RubyGems')
+            for line in lines
+            if (match := match_spec(line))
+        ]
         
         log(f"  Parsed {len(dependencies)} RubyGems dependencies")
         
     except Exception as e:
         log(f"  Error parsing Gemfile.lock: {e}", "ERROR")
     
-    return dependencies
+    return tuple(dependencies)
 
 
-def parse_go_mod_content(content: str) -> List[Dict[str, str]]:
+@_cached_parser
+def parse_go_mod_content(content: Union[str, bytes]) -> Tuple[Dep, ...]:
     """
     Parse go.mod content and extract Go module dependencies.
     
@@ -367,48 +577,72 @@ def parse_go_mod_content(content: str) -> List[Dict[str, str]]:
     And single-line format:
         require module/path v1.0.0
     
+    Any number of require blocks and single-line requires may be mixed;
+    each dependency is reported once, in file order. Comments and
+    indentation are ignored.
+    
     Args:
-        content: Raw content of go.mod
+        content: Raw content of go.mod (bytes or str)
     
     Returns:
-        List of dependency dictionaries for Go ecosystem.
+        Tuple of Dep for Go ecosystem.
     """
     dependencies = []
     
     try:
-        # Parse block-style require statements
-        require_block = re.search(r'require\s*\((.*?)\)', content, re.DOTALL)
+        text = _to_text(content)
         
-        if require_block:
-            for line in require_block.group(1).split('\n'):
-                # Match: module/path v1.0.0
-                match = re.match(r'\s*([^\s]+)\s+v?([^\s]+)', line)
-                if match and not match.group(1).startswith('//'):
-                    dependencies.append({
-                        'name': match.group(1),
-                        'version': match.group(2),
-                        'type': 'dependencies',
-                        'ecosystem': 'Go'
-                    })
+        # Jump straight to the line of the first 'require' with a literal
+        # search; the module/go/toolchain header before it has no
+        # dependencies, and a file without any require has none at all
+        start = text.find('require')
+        if start < 0:
+            log("  Parsed 0 Go dependencies")
+            return tuple(dependencies)
+        text = text[text.rfind('\n', 0, start) + 1:]
         
-        # Parse single-line require statements
-        for match in re.finditer(r'^require\s+([^\s]+)\s+v?([^\s\n]+)', content, re.MULTILINE):
-            dependencies.append({
-                'name': match.group(1),
-                'version': match.group(2),
-                'type': 'dependencies',
-                'ecosystem': 'Go'
-            })
+        # Single pass over the lines, tracking whether we are inside a
+        # require ( ... ) block
+        in_block = False
+        
+        for line in text.splitlines():
+            # Drop comments ("// indirect", commented-out requires)
+            line = line.partition('//')[0].strip()
+            
+            if in_block:
+                # End of block
+                if line == ')':
+                    in_block = False
+                    continue
+                fields = line.split()
+            elif line.startswith('require') and line[7:8] in (' ', '\t', '('):
+                rest = line[7:].strip()
+                if rest == '(':
+                    # Start of block-style require statement
+                    in_block = True
+                    continue
+                # Single-line require statement
+                fields = rest.split()
+            else:
+                continue
+            
+            # Match: module/path v1.0.0
+            if len(fields) >= 2:
+                name, version = fields[0], fields[1]
+                if version.startswith('v'):
+                    version = version[1:]
+                dependencies.append(Dep(name, version, 'dependencies', 'Go'))
         
         log(f"  Parsed {len(dependencies)} Go dependencies")
         
     except Exception as e:
         log(f"  Error parsing go.mod: {e}", "ERROR")
     
-    return dependencies
+    return tuple(dependencies)
 
 
-def parse_composer_json_content(content: str) -> List[Dict[str, str]]:
+@_cached_parser
+def parse_composer_json_content(content: Union[str, bytes]) -> Tuple[Dep, ...]:
     """
     Parse composer.json content and extract PHP dependencies.
     
@@ -416,41 +650,40 @@ def parse_composer_json_content(content: str) -> List[Dict[str, str]]:
     filtering out PHP version and extension requirements.
     
     Args:
-        content: Raw JSON content of composer.json
+        content: Raw JSON content of composer.json (bytes are parsed without decoding)
     
     Returns:
-        List of dependency dictionaries for Packagist ecosystem.
+        Tuple of Dep for Packagist ecosystem.
     """
     dependencies = []
     
     try:
-        data = json.loads(content)
+        data = orjson.loads(content)
+        append = dependencies.append
         
-        for dep_type in ['require', 'require-dev']:
-            if dep_type in data:
-                for name, version in data[dep_type].items():
-                    # Skip PHP version and extension requirements
-                    if name.startswith('php') or name.startswith('ext-'):
-                        continue
-                    
-                    # Clean version string
-                    version = re.sub(r'^[\^~>=<]', '', str(version)).split(' ')[0]
-                    
-                    dependencies.append({
-                        'name': name,
-                        'version': version,
-                        'type': dep_type,
-                        'ecosystem': 'Packagist'
-                    })
+        for dep_type in _COMPOSER_DEP_TYPES:
+            section = data.get(dep_type)
+            if not section:
+                continue
+            
+            for name, version in section.items():
+                # Skip PHP version and extension requirements
+                if name.startswith(('php', 'ext-')):
+                    continue
+                
+                # Clean version string
+                version = str(version).lstrip(_VERSION_PREFIX).partition(' ')[0]
+                
+                append(Dep(name, version, dep_type, 'Packagist'))
         
         log(f"  Parsed {len(dependencies)} Packagist dependencies")
         
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         log(f"  Error parsing composer.json: Invalid JSON - {e}", "ERROR")
     except Exception as e:
         log(f"  Error parsing composer.json: {e}", "ERROR")
     
-    return dependencies
+    return tuple(dependencies)
 
 
 def find_dependency_files_in_tree(file_list: List[str]) -> List[str]:
@@ -472,29 +705,18 @@ def find_dependency_files_in_tree(file_list: List[str]) -> List[str]:
         >>> find_dependency_files_in_tree(files)
         ['package.json']  # test/package.json is excluded
     """
-    found_files = []
-    
-    for file_path in file_list:
-        # Check if file is in a directory we should skip
-        should_skip = False
-        for skip_dir in SKIP_DIRECTORIES:
-            if skip_dir in file_path:
-                should_skip = True
-                break
-        
-        if should_skip:
-            continue
-        
-        # Check if filename matches a known dependency file
-        filename = file_path.split('/')[-1]
-        if filename in DEPENDENCY_FILES:
-            depth = file_path.count('/')
-            found_files.append((file_path, depth))
+    # Keep known dependency files outside skipped directories; the cheap
+    # filename check runs first since most files are not manifests
+    result = [
+        file_path
+        for file_path in file_list
+        if file_path.rpartition('/')[2] in _DEP_FILES and not _SKIP_RE.search(file_path)
+    ]
     
     # Sort by depth (shallow files first - more likely to be main config)
-    found_files.sort(key=lambda x: x[1])
+    # The sort is stable, so files at the same depth keep tree order
+    result.sort(key=lambda file_path: file_path.count('/'))
     
-    result = [f[0] for f in found_files]
     log(f"Found {len(result)} dependency files to analyze")
     
     return result
@@ -523,3 +745,47 @@ def get_parser_for_file(filename: str):
         Parser function or None if no parser exists.
     """
     return PARSERS.get(filename)
+
+
+def _dispatch(item: Tuple[str, Union[str, bytes]]) -> Tuple[Dep, ...]:
+    """Parse one (file_path, content) pair with the parser for its filename."""
+    file_path, content = item
+    parser = PARSERS.get(file_path.rpartition('/')[2])
+    return parser(content) if parser else ()
+
+
+def parse_all(files: Dict[str, Union[str, bytes]]) -> List[Dep]:
+    """
+    Parse many dependency files, in parallel for large batches.
+    
+    Each file is routed to its parser by filename. Batches of at least
+    PARSE_PARALLEL_MIN_FILES files are spread over a process pool, since
+    parsing is CPU-bound Python code; smaller batches are parsed serially
+    to avoid process startup costs.
+    
+    Intended for offline/CLI batch parsing; the web scanner parses files
+    one at a time as they are fetched. Workers are started with the
+    'spawn' method, so that no locks, threads or open connections of the
+    calling process are inherited by a forked child.
+    
+    Args:
+        files: Mapping of file path to raw file content (bytes or str)
+    
+    Returns:
+        Dependencies from all files, in the mapping's order.
+    
+    Example:
+        >>> deps = parse_all({"package.json": '{"dependencies": {"a": "1.0"}}'})
+        >>> deps[0].name
+        'a'
+    """
+    items = list(files.items())
+    
+    if len(items) < PARSE_PARALLEL_MIN_FILES:
+        results = map(_dispatch, items)
+        return [dep for deps in results for dep in deps]
+    
+    with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                             mp_context=get_context('spawn')) as executor:
+        results = executor.map(_dispatch, items, chunksize=8)
+        return [dep for deps in results for dep in deps]
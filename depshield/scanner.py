@@ -12,39 +12,58 @@ Author: Elif Sude ATES
 GitHub: https://github.com/elifsudeates/depshield
 """
 
-import json
+import sys
+import orjson
 import requests
-from typing import List, Dict, Any, Generator
+from bisect import bisect_right
+from requests.adapters import HTTPAdapter
+from collections import Counter
+from concurrent.futures import as_completed
+from flask_caching import Cache
+from itertools import islice
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Generator, Optional, Tuple
 
-from .config import OSV_API, OSV_TIMEOUT
-from .logger import log
-from .github_client import get_github_file_content, get_repo_tree
-from .parsers import (
-    find_dependency_files_in_tree,
-    parse_package_json_content,
-    parse_requirements_txt_content,
-    parse_pipfile_content,
-    parse_pyproject_toml_content,
-    parse_gemfile_lock_content,
-    parse_go_mod_content,
-    parse_composer_json_content
+from .config import (
+    OSV_API,
+    OSV_BATCH_API,
+    OSV_VULN_API,
+    OSV_BATCH_SIZE,
+    OSV_TIMEOUT,
+    OSV_CACHE_TIMEOUT,
+    OSV_CACHE_BYPASS,
+    SCAN_CACHE_TIMEOUT,
+    IO_MAX_WORKERS
 )
+from .logger import log
+from .cache import cache, osv_cache, cache_unbound
+from .concurrency import get_io_executor
+from .github_client import get_github_file_content, get_repo_tree_with_sha
+from .parsers import PARSERS, Dep, find_dependency_files_in_tree
+
 
+# CVSS score thresholds and the severity of each band between them:
+# below 4.0 LOW, from 4.0 MEDIUM, from 7.0 HIGH, from 9.0 CRITICAL
+_SEVERITY_THRESHOLDS = (4.0, 7.0, 9.0)
+_SEVERITY_LABELS = ('LOW', 'MEDIUM', 'HIGH', 'CRITICAL')
 
-# Mapping of internal ecosystem names to OSV API ecosystem names
-ECOSYSTEM_MAP = {
-    'npm': 'npm',
-    'PyPI': 'PyPI',
-    'RubyGems': 'RubyGems',
-    'Go': 'Go',
-    'Packagist': 'Packagist'
-}
+# Shared HTTP session for all OSV API calls
+# Keep-alive connections are reused across batch queries and the parallel
+# vulnerability detail fetches, so each worker thread skips the TCP/TLS
+# handshake after its first request. The pool is never smaller than the
+# I/O executor, so no worker waits on (or discards) a connection.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=max(32, IO_MAX_WORKERS)
+))
 
 
 def check_vulnerability_osv(
     package_name: str, 
     version: str, 
-    ecosystem: str
+    ecosystem: str,
+    session: Optional[requests.Session] = None
 ) -> List[Dict[str, Any]]:
     """
     Check a single package for known vulnerabilities using OSV API.
@@ -57,6 +76,7 @@ def check_vulnerability_osv(
         package_name: Name of the package to check
         version: Version string of the package
         ecosystem: Package ecosystem (npm, PyPI, Go, etc.)
+        session: HTTP session to use (default: the shared OSV session)
     
     Returns:
         List of vulnerability dictionaries, each containing:
@@ -75,15 +95,13 @@ def check_vulnerability_osv(
     """
     vulnerabilities = []
     
-    # Map internal ecosystem name to OSV API name
-    osv_ecosystem = ECOSYSTEM_MAP.get(ecosystem, ecosystem)
-    
     try:
         # Construct OSV API query
+        # Ecosystem names are already the ones OSV uses (see SUPPORTED_ECOSYSTEMS)
         payload = {
             "package": {
                 "name": package_name,
-                "ecosystem": osv_ecosystem
+                "ecosystem": ecosystem
             }
         }
         
@@ -92,10 +110,10 @@ def check_vulnerability_osv(
             payload["version"] = version
         
         # Query OSV API
-        response = requests.post(OSV_API, json=payload, timeout=OSV_TIMEOUT)
+        response = (session or _SESSION).post(OSV_API, json=payload, timeout=OSV_TIMEOUT)
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Process each vulnerability found
             if 'vulns' in data:
@@ -116,6 +134,205 @@ def check_vulnerability_osv(
     return vulnerabilities
 
 
+def check_vulnerabilities_osv_batch(
+    deps: List[Dep],
+    stats: Optional[Dict[str, int]] = None
+) -> List[List[Dict[str, Any]]]:
+    """
+    Check many packages for known vulnerabilities with OSV batch queries.
+    
+    Results are cached per package version for OSV_CACHE_TIMEOUT seconds.
+    Packages not in the cache are sent to the OSV querybatch endpoint in
+    chunks of OSV_BATCH_SIZE, which answers with vulnerability IDs only.
+    The full records of all distinct IDs are then fetched concurrently on
+    the shared I/O pool. One request per chunk replaces one per package.
+    
+    Args:
+        deps: Dependencies to check
+        stats: Optional dict whose 'hits' and 'misses' counts are
+            increased by the cache lookups of this call, and whose
+            'errors' count is increased by packages OSV did not fully answer
+    
+    Returns:
+        One list of vulnerability dictionaries per dependency, in the same
+        order as deps, in the format of check_vulnerability_osv().
+    
+    Example:
+        >>> deps = [Dep("lodash", "4.17.15", "dependencies", "npm")]
+        >>> vulns = check_vulnerabilities_osv_batch(deps)
+        >>> len(vulns) == len(deps)
+        True
+    """
+    keys = [f"osv:{dep.ecosystem}:{dep.name}:{dep.version}" for dep in deps]
+    
+    # Cached vulnerability lists; None marks a miss
+    found = [None] * len(deps) if OSV_CACHE_BYPASS else _cache_get_many(osv_cache, keys)
+    missing = [i for i, vulns in enumerate(found) if vulns is None]
+    
+    if stats is not None:
+        stats['hits'] = stats.get('hits', 0) + len(deps) - len(missing)
+        stats['misses'] = stats.get('misses', 0) + len(missing)
+    
+    if missing:
+        fresh = _query_osv_uncached([deps[i] for i in missing])
+        
+        # Only complete answers are cached; a failed request must not hide
+        # vulnerabilities for the whole cache timeout
+        to_cache = {}
+        for i, (vulns, complete) in zip(missing, fresh):
+            found[i] = vulns
+            if complete:
+                to_cache[keys[i]] = vulns
+        _cache_set_many(osv_cache, to_cache, OSV_CACHE_TIMEOUT)
+        
+        if stats is not None:
+            stats['errors'] = stats.get('errors', 0) + len(missing) - len(to_cache)
+    
+    # Each dependency gets its own copies, since callers annotate them
+    return [[dict(vuln) for vuln in vulns] for vulns in found]
+
+
+def _query_osv_uncached(deps: List[Dep]) -> List[Tuple[List[Dict[str, Any]], bool]]:
+    """
+    Query OSV for packages that are not cached.
+    
+    Args:
+        deps: Dependencies to check
+    
+    Returns:
+        One (vulnerabilities, complete) pair per dependency, in the same
+        order as deps. complete is False if the batch query or the fetch
+        of any of the dependency's vulnerability records failed.
+    """
+    # Vulnerability IDs per dependency, from the batch queries
+    # None marks dependencies whose batch query failed
+    dep_vuln_ids = []
+    for start in range(0, len(deps), OSV_BATCH_SIZE):
+        chunk = deps[start:start + OSV_BATCH_SIZE]
+        ids = _query_osv_batch(chunk)
+        dep_vuln_ids.extend(ids if ids is not None else [None] * len(chunk))
+    
+    # Fetch each distinct vulnerability once; dict.fromkeys keeps the order
+    vuln_ids = list(dict.fromkeys(
+        vuln_id for ids in dep_vuln_ids if ids for vuln_id in ids
+    ))
+    executor = get_io_executor()
+    futures = [executor.submit(_fetch_osv_vulnerability, vuln_id) for vuln_id in vuln_ids]
+    
+    try:
+        details = {vuln_id: future.result() for vuln_id, future in zip(vuln_ids, futures)}
+    finally:
+        for future in futures:
+            future.cancel()
+    
+    results = []
+    for ids in dep_vuln_ids:
+        if ids is None:
+            results.append(([], False))
+        else:
+            complete = all(details[vuln_id] is not None for vuln_id in ids)
+            # Records that could not be fetched are still reported by ID
+            results.append(([
+                details[vuln_id] or _parse_vulnerability({'id': vuln_id})
+                for vuln_id in ids
+            ], complete))
+    return results
+
+
+def _cache_get_many(store: Cache, keys: List[str]) -> List[Any]:
+    """Look up cached results; any cache failure counts as all misses."""
+    if cache_unbound(store):
+        return [None] * len(keys)
+    try:
+        return list(store.get_many(*keys))
+    except Exception as e:
+        log(f"✗ Cache lookup failed: {e}", "WARN")
+        return [None] * len(keys)
+
+
+def _cache_set_many(store: Cache, mapping: Dict[str, Any], timeout: int) -> None:
+    """Store results; cache failures do not affect the scan."""
+    if not mapping or cache_unbound(store):
+        return
+    try:
+        store.set_many(mapping, timeout=timeout)
+    except Exception as e:
+        log(f"✗ Cache update failed: {e}", "WARN")
+
+
+def _query_osv_batch(deps: List[Dep]) -> Optional[List[List[str]]]:
+    """
+    Send one OSV batch query and return the vulnerability IDs per dependency.
+    
+    Args:
+        deps: Up to OSV_BATCH_SIZE dependencies
+    
+    Returns:
+        List of vulnerability ID lists, in the same order as deps, or None
+        if the request failed.
+    """
+    queries = []
+    for dep in deps:
+        query = {
+            "package": {
+                "name": dep.name,
+                "ecosystem": dep.ecosystem
+            }
+        }
+        
+        # Add version if specified (not 'latest')
+        if dep.version and dep.version != 'latest':
+            query["version"] = dep.version
+        
+        queries.append(query)
+    
+    try:
+        response = _SESSION.post(OSV_BATCH_API, json={"queries": queries}, timeout=OSV_TIMEOUT)
+        
+        if response.status_code == 200:
+            results = orjson.loads(response.content).get('results', [])
+            return [
+                [vuln['id'] for vuln in result.get('vulns', [])]
+                for result in results
+            ]
+        
+        log(f"✗ OSV batch query failed: HTTP {response.status_code}", "WARN")
+        
+    except requests.exceptions.RequestException as e:
+        log(f"✗ OSV batch query failed: {e}", "WARN")
+    except Exception as e:
+        log(f"✗ OSV batch query failed: {e}", "WARN")
+    
+    return None
+
+
+def _fetch_osv_vulnerability(vuln_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Fetch the OSV record of a vulnerability and parse it.
+    
+    The record is parsed in the worker thread, so the raw response (with
+    its potentially large 'affected' ranges) is dropped as soon as the
+    output fields are extracted instead of being held for the whole batch.
+    
+    Args:
+        vuln_id: OSV vulnerability ID
+    
+    Returns:
+        Parsed vulnerability dictionary, or None if it could not be fetched.
+    """
+    try:
+        response = _SESSION.get(f"{OSV_VULN_API}/{vuln_id}", timeout=OSV_TIMEOUT)
+        if response.status_code == 200:
+            return _parse_vulnerability(orjson.loads(response.content))
+    except requests.exceptions.RequestException:
+        # Silent fail - the caller still reports the ID
+        pass
+    except Exception:
+        pass
+    
+    return None
+
+
 def _parse_vulnerability(vuln: Dict[str, Any]) -> Dict[str, Any]:
     """
     Parse raw OSV vulnerability data into standardized format.
@@ -130,22 +347,26 @@ def _parse_vulnerability(vuln: Dict[str, Any]) -> Dict[str, Any]:
         Normalized vulnerability dictionary.
     """
     severity = 'UNKNOWN'
-    cvss_score = None
     
     # Try to extract CVSS score from severity array
-    if 'severity' in vuln:
-        for sev in vuln['severity']:
-            if 'score' in sev:
-                cvss_score = sev.get('score')
-            # Prefer CVSS v3 score
-            if sev.get('type') == 'CVSS_V3':
-                cvss_score = sev.get('score')
+    # Prefer the newest CVSS version, otherwise take the first score listed
+    scores = {
+        sev.get('type') or 'UNKNOWN': sev.get('score')
+        for sev in vuln.get('severity', ())
+    }
+    cvss_score = (
+        scores.get('CVSS_V4') or scores.get('CVSS_V3') or scores.get('CVSS_V2')
+        or next(iter(scores.values()), None)
+    )
     
     # Try database-specific severity information
     if 'database_specific' in vuln:
         db_specific = vuln['database_specific']
         if 'severity' in db_specific:
+            # Decoded from JSON, so intern it to share one string per label
             severity = db_specific['severity']
+            if isinstance(severity, str):
+                severity = sys.intern(severity)
         if 'cvss' in db_specific:
             cvss_score = db_specific['cvss'].get('score')
     
@@ -153,24 +374,12 @@ def _parse_vulnerability(vuln: Dict[str, Any]) -> Dict[str, Any]:
     if cvss_score:
         try:
             score = float(cvss_score) if isinstance(cvss_score, str) else cvss_score
-            if score >= 9.0:
-                severity = 'CRITICAL'
-            elif score >= 7.0:
-                severity = 'HIGH'
-            elif score >= 4.0:
-                severity = 'MEDIUM'
-            else:
-                severity = 'LOW'
+            severity = _SEVERITY_LABELS[bisect_right(_SEVERITY_THRESHOLDS, score)]
         except (ValueError, TypeError):
             pass
     
     # Extract CVE ID from aliases
-    cve_id = None
-    if 'aliases' in vuln:
-        for alias in vuln['aliases']:
-            if alias.startswith('CVE-'):
-                cve_id = alias
-                break
+    cve_id = next((alias for alias in vuln.get('aliases', ()) if alias.startswith('CVE-')), None)
     
     return {
         'id': vuln.get('id', 'Unknown'),
@@ -179,54 +388,93 @@ def _parse_vulnerability(vuln: Dict[str, Any]) -> Dict[str, Any]:
         'severity': severity,
         'cvss_score': cvss_score,
         'published': vuln.get('published', 'Unknown'),
-        'references': [ref.get('url') for ref in vuln.get('references', [])[:3]]
+        'references': [ref.get('url') for ref in islice(vuln.get('references') or (), 3)]
     }
 
 
-def _send_event(event_type: str, data: Dict[str, Any]) -> str:
+def _send_event(event_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Format a Server-Sent Event (SSE) message.
+    Build a progress event.
+    
+    Events are plain dictionaries; formatting them as Server-Sent Events
+    is left to the web layer so non-streaming callers never pay for it.
     
     Args:
         event_type: Type of event (status, complete, error)
         data: Event data dictionary
     
     Returns:
-        Formatted SSE message string.
+        Event dictionary with a 'type' key.
+    """
+    return {'type': event_type, **data}
+
+
+def _utc_now() -> str:
+    """Current UTC time as an ISO 8601 string with a 'Z' suffix."""
+    return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+def _complete_event(results: Dict[str, Any], repo_info: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build the final 'complete' event.
+    
+    Stamps the results with the scan time (UTC), unless they already
+    carry one, and, when given, the repository info, so every consumer
+    receives the same report.
+    
+    Args:
+        results: Scan results dictionary
+        repo_info: Repository info from get_repo_info(), or None
+    
+    Returns:
+        Event dictionary of type 'complete'.
     """
-    return f"data: {json.dumps({'type': event_type, **data})}\n\n"
+    if 'scan_time' not in results:
+        results['scan_time'] = _utc_now()
+    if repo_info is not None:
+        results['repo_info'] = repo_info
+    return _send_event('complete', {'results': results})
 
 
-def scan_with_progress(owner: str, repo: str) -> Generator[str, None, None]:
+def scan_with_progress(
+    owner: str, 
+    repo: str, 
+    repo_info: Optional[Dict[str, Any]] = None
+) -> Generator[Dict[str, Any], None, None]:
     """
     Scan a repository for dependency vulnerabilities with real-time progress.
     
     This generator function performs a complete vulnerability scan and yields
-    SSE-formatted progress updates. It's designed to be used with Flask's
-    streaming response for real-time frontend updates.
+    progress events as dictionaries. The web layer serializes them as SSE
+    messages for real-time frontend updates.
     
     Scanning process:
     1. Fetch repository file tree from GitHub
     2. Identify dependency files
-    3. Download and parse each dependency file
-    4. Deduplicate dependencies
-    5. Check each unique package against OSV database
+    3. Download (in parallel) and parse each dependency file
+    4. Collect unique dependencies (duplicates are dropped while parsing)
+    5. Check the unique packages against OSV database (batch queries)
     6. Compile and return results
     
+    Results are cached by repository tree SHA for SCAN_CACHE_TIMEOUT
+    seconds, so rescanning an unchanged repository skips steps 2-5.
+    
     Args:
         owner: Repository owner (username or organization)
         repo: Repository name
+        repo_info: Repository info to include in the final results (optional)
     
     Yields:
-        SSE-formatted event strings with progress updates.
+        Event dictionaries with progress updates.
         Event types:
         - 'status': Progress update with message and percentage
-        - 'complete': Final results
+        - 'complete': Final results, stamped with 'scan_time' (UTC);
+          'cached' is True if they were reused from an earlier scan
         - 'error': Error message
     
     Example:
         >>> for event in scan_with_progress("expressjs", "express"):
-        ...     print(event)  # SSE formatted string
+        ...     print(event['type'])
     """
     yield _send_event('status', {'message': 'Connecting to GitHub API...', 'progress': 5})
     log(f"Starting scan for {owner}/{repo}")
@@ -235,12 +483,28 @@ def scan_with_progress(owner: str, repo: str) -> Generator[str, None, None]:
     # STEP 1: Fetch repository file tree
     # =========================================================================
     yield _send_event('status', {'message': 'Fetching repository structure...', 'progress': 10})
-    file_list, error = get_repo_tree(owner, repo)
+    tree, error = get_repo_tree_with_sha(owner, repo)
     
     if error:
         yield _send_event('error', {'message': f'Could not fetch repository: {error}'})
         return
     
+    file_list = tree['files']
+    
+    # An unchanged tree SHA means unchanged dependency files
+    scan_key = f"scan:{owner}/{repo}:{tree['sha']}" if tree['sha'] else None
+    if scan_key and not OSV_CACHE_BYPASS:
+        cached_results = _cache_get_many(cache, [scan_key])[0]
+        if cached_results is not None:
+            log(f"✓ Using cached results for {owner}/{repo} at {tree['sha'][:7]}")
+            
+            # scan_time stays that of the original scan, whose OSV data
+            # (and osv_cache counts) are being served
+            cached_results['cached'] = True
+            yield _send_event('status', {'message': 'Repository unchanged, using cached results', 'progress': 100})
+            yield _complete_event(cached_results, repo_info)
+            return
+    
     yield _send_event('status', {
         'message': f'Found {len(file_list)} files in repository', 
         'progress': 15
@@ -255,9 +519,7 @@ def scan_with_progress(owner: str, repo: str) -> Generator[str, None, None]:
     # Handle case where no dependency files are found
     if not dep_files:
         yield _send_event('status', {'message': 'No dependency files found', 'progress': 100})
-        yield _send_event('complete', {
-            'results': _create_empty_results()
-        })
+        yield _complete_event(_create_empty_results(), repo_info)
         return
     
     yield _send_event('status', {
@@ -268,66 +530,96 @@ def scan_with_progress(owner: str, repo: str) -> Generator[str, None, None]:
     
     # Initialize results structure
     results = _create_empty_results()
-    all_dependencies = []
+    
+    # Results are only cached if every file and OSV lookup succeeded
+    all_files_parsed = True
+    
+    # Unique dependencies keyed by (ecosystem, name, version); the first
+    # occurrence wins and dict order keeps the discovery order
+    unique_map = {}
     
     # =========================================================================
-    # STEP 3: Parse each dependency file
+    # STEP 3: Download and parse each dependency file
     # =========================================================================
     file_progress_step = 20 / max(len(dep_files), 1)
     
-    for i, file_path in enumerate(dep_files):
-        progress = 25 + int(i * file_progress_step)
-        yield _send_event('status', {
-            'message': f'Downloading: {file_path}', 
-            'progress': progress, 
-            'current_file': file_path
-        })
-        
-        # Download file content
-        content, error = get_github_file_content(owner, repo, file_path)
-        if error or not content:
-            log(f"Skipping {file_path}: {error}")
+    yield _send_event('status', {
+        'message': f'Downloading {len(dep_files)} dependency files...', 
+        'progress': 25
+    })
+    
+    # Downloads run in parallel on the shared I/O pool and each file is
+    # parsed as soon as it arrives; results are merged in file order below,
+    # so the report does not depend on download timing
+    executor = get_io_executor()
+    futures = {
+        executor.submit(get_github_file_content, owner, repo, file_path, tree['branch']): i
+        for i, file_path in enumerate(dep_files)
+    }
+    parsed = [None] * len(dep_files)
+    
+    try:
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            file_path = dep_files[i]
+            progress = 25 + int(done * file_progress_step)
+            
+            content, error = future.result()
+            if error or not content:
+                log(f"Skipping {file_path}: {error}")
+                all_files_parsed = False
+                continue
+            
+            # Parse dependencies based on file type
+            filename = file_path.rpartition('/')[2]
+            parser = PARSERS.get(filename)
+            deps = parser(content) if parser else ()
+            parsed[i] = deps
+            
+            # One event per file: parsing is quick enough that a separate
+            # "Parsing:" event would be superseded almost immediately
+            # No 'current_file' here, since the UI would show that in place
+            # of the message as if the file were still being processed
+            yield _send_event('status', {
+                'message': f'Found {len(deps)} dependencies in {filename}', 
+                'progress': progress, 
+                'deps_count': len(deps)
+            })
+    finally:
+        # Drop queued downloads if the client went away mid-scan
+        for future in futures:
+            future.cancel()
+    
+    for file_path, deps in zip(dep_files, parsed):
+        if deps is None:
             continue
         
         results['files_scanned'].append(file_path)
-        
-        yield _send_event('status', {
-            'message': f'Parsing: {file_path}', 
-            'progress': progress + 2, 
-            'current_file': file_path
-        })
-        
-        # Parse dependencies based on file type
-        filename = file_path.split('/')[-1]
-        deps = _parse_dependency_file(filename, content)
-        
-        all_dependencies.extend(deps)
-        yield _send_event('status', {
-            'message': f'Found {len(deps)} dependencies in {filename}', 
-            'progress': progress + 5, 
-            'deps_count': len(deps)
-        })
+        for dep in deps:
+            unique_map.setdefault((dep.ecosystem, dep.name, dep.version), dep)
     
     # =========================================================================
-    # STEP 4: Deduplicate dependencies
+    # STEP 4: Collect unique dependencies
     # =========================================================================
-    yield _send_event('status', {'message': 'Removing duplicate dependencies...', 'progress': 50})
+    unique_deps = list(unique_map.values())
     
-    seen = set()
-    unique_deps = []
-    for dep in all_dependencies:
-        key = f"{dep['ecosystem']}:{dep['name']}:{dep['version']}"
-        if key not in seen:
-            seen.add(key)
-            unique_deps.append(dep)
+    # Without a version OSV would return every vulnerability ever recorded
+    # for the package, so unversioned dependencies are reported unchecked
+    versioned = []
+    results['dependencies'] = []
+    for dep in unique_deps:
+        # Dep tuples become JSON objects for the report
+        entry = dep._asdict()
+        if dep.version and dep.version != 'latest':
+            versioned.append(dep)
+        else:
+            entry['version_unknown'] = True
+        results['dependencies'].append(entry)
     
-    results['dependencies'] = unique_deps
     results['summary']['total_dependencies'] = len(unique_deps)
     
     # Count dependencies by ecosystem
-    for dep in unique_deps:
-        eco = dep['ecosystem']
-        results['ecosystems'][eco] = results['ecosystems'].get(eco, 0) + 1
+    results['ecosystems'] = dict(Counter(eco for eco, _, _ in unique_map))
     
     yield _send_event('status', {
         'message': f'Total unique dependencies: {len(unique_deps)}', 
@@ -338,73 +630,83 @@ def scan_with_progress(owner: str, repo: str) -> Generator[str, None, None]:
     # Handle case where no dependencies were found
     if len(unique_deps) == 0:
         yield _send_event('status', {'message': 'No dependencies to scan', 'progress': 100})
-        yield _send_event('complete', {'results': results})
+        yield _complete_event(results, repo_info)
         return
     
     # =========================================================================
     # STEP 5: Check vulnerabilities for each package
     # =========================================================================
     vulnerable_packages = set()
-    vuln_progress_step = 45 / len(unique_deps)
+    severity_counts = Counter()
+    vuln_progress_step = 45 / max(len(versioned), 1)
+    
+    skipped = len(unique_deps) - len(versioned)
+    if skipped:
+        log(f"Skipping {skipped} dependencies without a pinned version")
     
     yield _send_event('status', {
-        'message': f'Checking {len(unique_deps)} packages for vulnerabilities...', 
+        'message': f'Checking {len(versioned)} packages for vulnerabilities...', 
         'progress': 55
     })
     
-    for i, dep in enumerate(unique_deps):
-        progress = 55 + int(i * vuln_progress_step)
+    # One OSV batch query per chunk; progress is reported per chunk
+    total = len(versioned)
+    
+    for start in range(0, total, OSV_BATCH_SIZE):
+        chunk = versioned[start:start + OSV_BATCH_SIZE]
+        log(f"Checking vulnerabilities: packages {start + 1}-{start + len(chunk)} of {total}")
         
-        # Send progress update every 5 packages to reduce overhead
-        if i % 5 == 0 or i == len(unique_deps) - 1:
-            yield _send_event('status', {
-                'message': f'Checking: {dep["name"]}@{dep["version"]} ({i+1}/{len(unique_deps)})',
-                'progress': progress,
-                'current_package': dep['name'],
-                'packages_checked': i + 1,
-                'total_packages': len(unique_deps)
-            })
+        chunk_vulns = check_vulnerabilities_osv_batch(chunk, stats=results['osv_cache'])
+        found_before = len(results['vulnerabilities'])
         
-        log(f"Checking vulnerability: {dep['ecosystem']}/{dep['name']}@{dep['version']} ({i+1}/{len(unique_deps)})")
+        for dep, vulns in zip(chunk, chunk_vulns):
+            if vulns:
+                vulnerable_packages.add((dep.ecosystem, dep.name))
+                
+                # Add vulnerability details to results
+                for vuln in vulns:
+                    vuln['package'] = dep.name
+                    vuln['version'] = dep.version
+                    vuln['ecosystem'] = dep.ecosystem
+                results['vulnerabilities'].extend(vulns)
+                severity_counts.update(vuln['severity'].upper() for vuln in vulns)
         
-        # Query OSV for vulnerabilities
-        vulns = check_vulnerability_osv(dep['name'], dep['version'], dep['ecosystem'])
+        # One log line per chunk instead of one per vulnerable package
+        found = len(results['vulnerabilities']) - found_before
+        if found:
+            log(f"  ⚠ Found {found} vulnerabilities in packages {start + 1}-{start + len(chunk)}!")
         
-        if vulns:
-            log(f"  ⚠ Found {len(vulns)} vulnerabilities!")
-            vulnerable_packages.add(f"{dep['ecosystem']}:{dep['name']}")
-            
-            # Add vulnerability details to results
-            for vuln in vulns:
-                vuln['package'] = dep['name']
-                vuln['version'] = dep['version']
-                vuln['ecosystem'] = dep['ecosystem']
-                results['vulnerabilities'].append(vuln)
-                
-                # Update severity counts
-                severity = vuln['severity'].upper()
-                if severity == 'CRITICAL':
-                    results['summary']['critical'] += 1
-                elif severity == 'HIGH':
-                    results['summary']['high'] += 1
-                elif severity == 'MEDIUM':
-                    results['summary']['medium'] += 1
-                elif severity == 'LOW':
-                    results['summary']['low'] += 1
-                else:
-                    results['summary']['unknown'] += 1
-    
-    # Finalize summary counts
+        checked = start + len(chunk)
+        yield _send_event('status', {
+            'message': f'Checked {checked}/{total} packages',
+            'progress': 55 + int(checked * vuln_progress_step),
+            'packages_checked': checked,
+            'total_packages': total
+        })
+    
+    # Finalize summary counts; severities outside the known labels
+    # (e.g. 'MODERATE' from database_specific) count as unknown
+    known = 0
+    for severity in _SEVERITY_LABELS:
+        results['summary'][severity.lower()] = severity_counts[severity]
+        known += severity_counts[severity]
+    results['summary']['unknown'] = sum(severity_counts.values()) - known
     results['summary']['vulnerable_dependencies'] = len(vulnerable_packages)
     results['summary']['total_vulnerabilities'] = len(results['vulnerabilities'])
     
     log(f"Scan complete! Found {len(results['vulnerabilities'])} vulnerabilities in {len(vulnerable_packages)} packages")
+    log(f"OSV cache: {results['osv_cache']['hits']} hits, {results['osv_cache']['misses']} misses")
+    
+    # Stamped before caching, so cached copies keep the original scan time
+    results['scan_time'] = _utc_now()
+    if scan_key and all_files_parsed and not results['osv_cache']['errors']:
+        _cache_set_many(cache, {scan_key: results}, SCAN_CACHE_TIMEOUT)
     
     # =========================================================================
     # STEP 6: Return final results
     # =========================================================================
     yield _send_event('status', {'message': 'Scan complete!', 'progress': 100})
-    yield _send_event('complete', {'results': results})
+    yield _complete_event(results, repo_info)
 
 
 def _create_empty_results() -> Dict[str, Any]:
@@ -423,34 +725,7 @@ def _create_empty_results() -> Dict[str, Any]:
             'unknown': 0
         },
         'ecosystems': {},
-        'files_scanned': []
+        'files_scanned': [],
+        'osv_cache': {'hits': 0, 'misses': 0, 'errors': 0},  # OSV cache lookups and failed queries
+        'cached': False  # True when served from the scan result cache
     }
-
-
-def _parse_dependency_file(filename: str, content: str) -> List[Dict[str, str]]:
-    """
-    Parse a dependency file and return list of dependencies.
-    
-    Routes to the appropriate parser based on filename.
-    
-    Args:
-        filename: Name of the dependency file
-        content: Raw content of the file
-    
-    Returns:
-        List of dependency dictionaries.
-    """
-    parsers = {
-        'package.json': parse_package_json_content,
-        'requirements.txt': parse_requirements_txt_content,
-        'Pipfile': parse_pipfile_content,
-        'pyproject.toml': parse_pyproject_toml_content,
-        'Gemfile.lock': parse_gemfile_lock_content,
-        'go.mod': parse_go_mod_content,
-        'composer.json': parse_composer_json_content,
-    }
-    
-    parser = parsers.get(filename)
-    if parser:
-        return parser(content)
-    return []
@@ -0,0 +1,25 @@
+# =============================================================================
+# DepShield - Gunicorn Configuration
+# =============================================================================
+# Loaded automatically by `gunicorn app:app` from the working directory.
+# Used by the Dockerfile and the Procfile.
+#
+# Author: Elif Sude ATES
+# GitHub: https://github.com/elifsudeates/depshield
+# =============================================================================
+
+import os
+
+# Bind address (PORT is set by most PaaS platforms)
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# Threaded workers: scans block on GitHub/OSV I/O and each SSE client
+# holds a thread, so 4 workers x 8 threads serve ~32 concurrent scans
+worker_class = "gthread"
+workers = int(os.getenv("GUNICORN_WORKERS", "4"))
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+
+# SSE connections stay open for the whole scan, so never kill a worker
+# for being silent; keep idle connections open past the OSV timeout
+timeout = 0
+keepalive = 75